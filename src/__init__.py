@@ -4,6 +4,16 @@ Personal Organization System (POS) - A command-line task management system
 
 from .models import ItemType, ItemStatus, Priority, WorkItem
 from .storage import WorkSystem
-from .cli import WorkSystemCLI
 
-__version__ = "0.010" 
\ No newline at end of file
+__version__ = "0.010"
+
+__all__ = ["ItemType", "ItemStatus", "Priority", "WorkItem", "WorkSystem", "WorkSystemCLI"]
+
+
+def __getattr__(name):
+    # The CLI pulls in rich's console, prompt and tree rendering; import it
+    # only when it is asked for, so using the models or storage stays cheap
+    if name == "WorkSystemCLI":
+        from .cli import WorkSystemCLI
+        return WorkSystemCLI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
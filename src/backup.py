@@ -1,19 +1,20 @@
 import shutil
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 import json
 import sqlite3
-import os
+
+from .config import Config
 
 class BackupManager:
     def __init__(self, db_path: str = "work_items.db"):
-        # Get the absolute path of the project root directory
-        self.base_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_dir = self.base_dir / "data"
-        self.db_path = self.data_dir / "db" / db_path
-        self.backup_dir = self.data_dir / "backups"
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.base_dir = Config.BASE_DIR
+        self.data_dir = Config.DATA_DIR
+        self.db_path = Config.get_db_path(db_path)
+        self.db_path_str = str(self.db_path)
+        self.backup_dir = Config.BACKUP_DIR
 
     def create_backup(self, note: Optional[str] = None) -> Path:
         """Create a timestamped backup of the database"""
@@ -21,8 +22,10 @@ class BackupManager:
         note_suffix = f"_{note}" if note else ""
         backup_path = self.backup_dir / f"work_items_{timestamp}{note_suffix}.db"
         
-        # Ensure database is in a consistent state
-        with sqlite3.connect(self.db_path) as conn:
+        # Ensure database is in a consistent state. The connection is closed
+        # explicitly (sqlite3's own context manager only commits), so it can't
+        # linger and block a restore that follows this backup
+        with closing(sqlite3.connect(self.db_path_str)) as conn:
             conn.execute("PRAGMA wal_checkpoint(FULL)")
         
         # Create backup
@@ -37,8 +40,26 @@ class BackupManager:
         # Create backup of current database before restore
         self.create_backup(note="pre_restore")
         
-        # Restore database
-        shutil.copy2(backup_path, self.db_path)
+        # Restore through SQLite's backup API rather than copying over the file:
+        # in WAL mode a raw copy would leave stale -wal frames applied on top
+        source = sqlite3.connect(str(backup_path))
+        target = sqlite3.connect(self.db_path_str)
+        wal = False
+        try:
+            # A WAL database cannot change its page size, and the backup may
+            # use a different one: restore in rollback-journal mode, then
+            # switch back to WAL whether or not the restore succeeded
+            wal = target.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            if wal:
+                target.execute("PRAGMA journal_mode=DELETE")
+            source.backup(target)
+        finally:
+            source.close()
+            try:
+                if wal:
+                    target.execute("PRAGMA journal_mode=WAL")
+            finally:
+                target.close()
 
     def list_backups(self) -> List[Path]:
         """List all available backups"""
@@ -60,7 +81,7 @@ class BackupManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = self.backup_dir / f"work_items_{timestamp}.json"
 
-        with sqlite3.connect(self.db_path) as conn:
+        with sqlite3.connect(self.db_path_str) as conn:
             conn.row_factory = sqlite3.Row
             # Export work items
             cursor = conn.execute("SELECT * FROM work_items")
@@ -1,16 +1,22 @@
 import cmd
+import time
+from functools import cached_property
 from rich.prompt import Prompt
 from pathlib import Path
-from datetime import datetime
-from rich.table import Table
 
 from .models import ItemType, ItemStatus, Priority
 from .storage import WorkSystem
 from .display import Display
 from .schemas import AddItemInput, UpdateItemInput
 from pydantic import ValidationError
-from .backup import BackupManager
-from .migrate import MigrationManager
+
+# Link types in display order, plus a set for O(1) membership checks
+_LINK_TYPES = ("references", "evolves-from", "inspired-by", "parent-child")
+_VALID_LINK_TYPES = frozenset(_LINK_TYPES)
+
+# Enum lookups for parsed command values (type code -> ItemType, priority name -> Priority)
+_TYPE_MAP = {m.value: m for m in ItemType}
+_PRIO_MAP = {m.name: m for m in Priority}
 
 class WorkSystemCLI(cmd.Cmd):
     """
@@ -46,12 +52,42 @@ class WorkSystemCLI(cmd.Cmd):
         super().__init__()
         self.work_system = WorkSystem()
         self.display = Display()
-        self.backup_manager = BackupManager()
-        self.migration_manager = MigrationManager()
+        # Shares the work system's manager; both point at the same database file
+        self.backup_manager = self.work_system.backup_manager
+        # Created on first use by do_migrate
+        self.migration_manager = None
+        # Command name -> bound do_* method, so onecmd needs no getattr per line
+        self._cmd_table = {
+            name[3:]: getattr(self, name)
+            for name in self.get_names() if name.startswith('do_')
+        }
         # Display welcome message using rich
         self.display.console.print("[bold green]Welcome to the Work System CLI![/bold green]")
         self.display.console.print("Type [yellow]help[/yellow] or [yellow]?[/yellow] to list commands.\n")
 
+    def onecmd(self, line):
+        """
+        Run one command via the dispatch table built in __init__.
+        Mirrors cmd.Cmd.onecmd without a getattr per line; unexpected errors
+        are reported here instead of ending the loop.
+        """
+        cmd_name, arg, line = self.parseline(line)
+        if not line:
+            return self.emptyline()
+        if cmd_name is None:
+            return self.default(line)
+        self.lastcmd = line
+        if line == 'EOF':
+            self.lastcmd = ''
+        func = self._cmd_table.get(cmd_name)
+        if func is None:
+            return self.default(line)
+        try:
+            return func(arg)
+        except Exception as e:
+            self.display.print_error(f"Unexpected error: {e}")
+            return False
+
     def do_add(self, arg):
         """
         Adds new work items, including thoughts. Example usage:
@@ -84,8 +120,8 @@ class WorkSystemCLI(cmd.Cmd):
             # Create item
             item = self.work_system.add_item(
                 goal=input_data.goal,
-                item_type=ItemType(input_data.type_),
-                priority=Priority[input_data.priority],
+                item_type=_TYPE_MAP[input_data.type_],
+                priority=_PRIO_MAP[input_data.priority],
                 title=input_data.title,
                 description=input_data.description
             )
@@ -126,7 +162,7 @@ class WorkSystemCLI(cmd.Cmd):
                 message = error["msg"]
                 errors.append(f"{field}: {message}")
             self.display.print_error("\n".join(errors))
-        except Exception as e:
+        except (ValueError, KeyError, RuntimeError) as e:
             self.display.print_error(str(e))
 
     def do_list(self, arg):
@@ -139,23 +175,19 @@ class WorkSystemCLI(cmd.Cmd):
         - list all              (everything)
         - list thoughts         (all thought items)
         """
-        args = arg.lower().strip().split()
+        raw = arg.strip()
+        if not raw:
+            self.display.print_warning("Please specify what to list. Type 'help list' for options.")
+            return
+        args = raw.lower().split(maxsplit=2)
         
         try:
-            if not args:
-                self.display.print_warning("Please specify what to list. Type 'help list' for options.")
-                return
-
             if args[0] == 'incomplete':
                 self.display.print_items(self.work_system.get_incomplete_items())
                 return
 
             if args[0] == 'all':
-                goals = self.work_system.get_all_goals()
-                for goal in goals:
-                    items = self.work_system.get_items_by_goal(goal)
-                    if items:
-                        self.display.print_items(items)
+                self.display.print_items_grouped(self.work_system.get_items_grouped_by_goal())
                 return
                 
             if args[0] == 'thoughts':
@@ -195,7 +227,7 @@ class WorkSystemCLI(cmd.Cmd):
         - list_thoughts           (all thoughts)
         - list_thoughts ProjectA  (thoughts for specific goal)
         """
-        args = arg.lower().strip().split()
+        args = arg.lower().strip().split(maxsplit=1)
         try:
             if not args:
                 # List all thoughts
@@ -208,8 +240,7 @@ class WorkSystemCLI(cmd.Cmd):
             
             # Filter thoughts by goal
             goal = args[0]
-            all_thoughts = self.work_system.get_items_by_type(ItemType.THOUGHT)
-            goal_thoughts = [t for t in all_thoughts if t.goal.lower() == goal.lower()]
+            goal_thoughts = self.work_system.get_thoughts_by_goal(goal)
             
             if goal_thoughts:
                 self.display.print_items(goal_thoughts)
@@ -242,7 +273,7 @@ class WorkSystemCLI(cmd.Cmd):
             elif input_data.field == "priority":
                 self.work_system.update_item_priority(
                     input_data.item_id,
-                    Priority[input_data.value.upper()]
+                    _PRIO_MAP[input_data.value.upper()]
                 )
                 
             self.display.print_success(f"Updated item {input_data.item_id}")
@@ -254,7 +285,7 @@ class WorkSystemCLI(cmd.Cmd):
                 message = error["msg"]
                 errors.append(f"{field}: {message}")
             self.display.print_error("\n".join(errors))
-        except Exception as e:
+        except (ValueError, KeyError, RuntimeError) as e:
             self.display.print_error(str(e))
 
     def do_export(self, arg):
@@ -299,7 +330,7 @@ class WorkSystemCLI(cmd.Cmd):
         """
         try:
             # Parse arguments
-            args = arg.strip().split()
+            args = arg.strip().split(maxsplit=2)
             
             # Default settings
             root_id = None
@@ -420,8 +451,7 @@ class WorkSystemCLI(cmd.Cmd):
             
         try:
             backup_path = Path("backups") / arg.strip()
-            self.work_system.backup_manager.restore_backup(backup_path)
-            self.work_system._refresh_cache()  # Refresh cache after restore
+            self.work_system.restore_backup(backup_path)
             self.display.print_success("Database restored successfully")
         except Exception as e:
             self.display.print_error(f"Restore failed: {str(e)}")
@@ -431,6 +461,8 @@ class WorkSystemCLI(cmd.Cmd):
         List all available backups.
         Usage: list_backups
         """
+        from rich.table import Table
+        
         try:
             backups = self.work_system.backup_manager.list_backups()
             if not backups:
@@ -443,12 +475,12 @@ class WorkSystemCLI(cmd.Cmd):
             table.add_column("Created", style="yellow")
             
             for backup in backups:
-                size_mb = backup.stat().st_size / (1024 * 1024)
-                created = datetime.fromtimestamp(backup.stat().st_mtime)
+                st = backup.stat()
+                size_mb = st.st_size / (1024 * 1024)
                 table.add_row(
                     str(backup.name),
                     f"{size_mb:.2f} MB",
-                    created.strftime("%Y-%m-%d %H:%M:%S")
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st.st_mtime))
                 )
                 
             self.display.console.print(table)
@@ -488,21 +520,31 @@ class WorkSystemCLI(cmd.Cmd):
         Migrate data from JSON to SQLite database
         Usage: migrate [json_path]
         """
+        from .migrate import MigrationManager
+        
         try:
             json_path = arg.strip() if arg else "work_items.json"
-            self.migration_manager = MigrationManager(json_path=json_path)
+            # Migrate through the work system's open database rather than
+            # opening a second set of connections to the same file
+            self.migration_manager = MigrationManager(
+                json_path=json_path,
+                db=self.work_system.db,
+                backup_manager=self.work_system.backup_manager
+            )
             
             processed_count, errors = self.migration_manager.migrate_json_to_sqlite()
             
             if errors:
-                self.display.print_error("Migration completed with errors:")
-                for error in errors:
-                    self.display.print_error(f"- {error}")
+                with self.display.batched():
+                    self.display.print_error("Migration completed with errors:")
+                    for error in errors:
+                        self.display.print_error(f"- {error}")
             else:
                 self.display.print_success(f"Successfully migrated {processed_count} items")
                 
-            # Refresh work system to load migrated data
-            self.work_system = WorkSystem()
+            # Reload migrated data into the existing work system; rows were
+            # validated on their way into the database, so skip revalidation
+            self.work_system._refresh_cache(validate=False)
             
         except Exception as e:
             self.display.print_error(f"Migration failed: {str(e)}")
@@ -526,7 +568,7 @@ class WorkSystemCLI(cmd.Cmd):
         """
         try:
             # Parse arguments
-            args = arg.strip().split()
+            args = arg.strip().split(maxsplit=3)
             if len(args) < 2:
                 self.display.print_error("Please provide source and target IDs. Type 'help link' for usage.")
                 return
@@ -536,20 +578,21 @@ class WorkSystemCLI(cmd.Cmd):
             link_type = args[2] if len(args) > 2 else "references"
             
             # Validate IDs exist
-            if source_id not in self.work_system.items:
+            source_item = self.work_system.items.get(source_id)
+            if source_item is None:
                 self.display.print_error(f"Source item not found: {source_id}")
                 return
                 
-            if target_id not in self.work_system.items:
+            target_item = self.work_system.items.get(target_id)
+            if target_item is None:
                 self.display.print_error(f"Target item not found: {target_id}")
                 return
                 
             # Validate link type
-            valid_link_types = ["references", "evolves-from", "inspired-by", "parent-child"]
-            if link_type not in valid_link_types:
+            if link_type not in _VALID_LINK_TYPES:
                 self.display.print_error(
                     f"Invalid link type: {link_type}\n"
-                    f"Valid types: {', '.join(valid_link_types)}"
+                    f"Valid types: {', '.join(_LINK_TYPES)}"
                 )
                 return
                 
@@ -557,9 +600,6 @@ class WorkSystemCLI(cmd.Cmd):
             success = self.work_system.add_link(source_id, target_id, link_type)
             
             if success:
-                source_item = self.work_system.items[source_id]
-                target_item = self.work_system.items[target_id]
-                
                 self.display.print_success(
                     f"Link created successfully:\n"
                     f"  Source: {source_item.title} (ID: {source_id})\n"
@@ -584,7 +624,7 @@ class WorkSystemCLI(cmd.Cmd):
         """
         try:
             # Parse arguments
-            args = arg.strip().split()
+            args = arg.strip().split(maxsplit=2)
             if len(args) != 2:
                 self.display.print_error("Please provide source and target IDs. Type 'help unlink' for usage.")
                 return
@@ -593,11 +633,13 @@ class WorkSystemCLI(cmd.Cmd):
             target_id = args[1]
             
             # Validate IDs exist
-            if source_id not in self.work_system.items:
+            source_item = self.work_system.items.get(source_id)
+            if source_item is None:
                 self.display.print_error(f"Source item not found: {source_id}")
                 return
                 
-            if target_id not in self.work_system.items:
+            target_item = self.work_system.items.get(target_id)
+            if target_item is None:
                 self.display.print_error(f"Target item not found: {target_id}")
                 return
                 
@@ -605,9 +647,6 @@ class WorkSystemCLI(cmd.Cmd):
             success = self.work_system.remove_link(source_id, target_id)
             
             if success:
-                source_item = self.work_system.items[source_id]
-                target_item = self.work_system.items[target_id]
-                
                 self.display.print_success(
                     f"Link removed successfully:\n"
                     f"  Source: {source_item.title} (ID: {source_id})\n"
@@ -624,6 +663,28 @@ class WorkSystemCLI(cmd.Cmd):
         self.display.print_success("Goodbye!")
         return True
 
+    def postloop(self):
+        """Close the cached database connection when the command loop exits"""
+        self.work_system.db.close()
+
+    @cached_property
+    def _help_lines(self):
+        """Command list for 'help' formatted in columns; commands never change, so build it once"""
+        cmds = sorted(
+            name[3:] for name in self.get_names()
+            if name[:3] == 'do_' and name != 'do_help'
+        )
+        
+        # Format in columns
+        max_len = max(map(len, cmds))
+        cols = 4
+        col_width = max_len + 2
+        
+        return [
+            "".join(f"[blue]{cmd:<{col_width}}[/blue]" for cmd in cmds[i:i+cols])
+            for i in range(0, len(cmds), cols)
+        ]
+
     def do_help(self, arg):
         """List available commands with help text."""
         if arg:
@@ -646,23 +707,7 @@ class WorkSystemCLI(cmd.Cmd):
             self.display.console.print("\n[yellow]Documented commands[/yellow] (type [yellow]help[/yellow] [blue]<topic>[/blue]):")
             self.display.console.print("=" * 40)
             
-            cmds = []
-            for name in self.get_names():
-                if name[:3] == 'do_' and name != 'do_help':
-                    cmds.append(name[3:])
-            
-            # Format in columns
-            max_len = max(map(len, cmds))
-            cols = 4
-            col_width = max_len + 2
-            
-            # Print commands in rows
-            cmds.sort()
-            for i in range(0, len(cmds), cols):
-                row = cmds[i:i+cols]
-                line = ""
-                for cmd in row:
-                    line += f"[blue]{cmd:<{col_width}}[/blue]"
+            for line in self._help_lines:
                 self.display.console.print(line)
             
             self.display.console.print()
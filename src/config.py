@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+class Config:
+    """Filesystem locations used by the POS system, resolved once at import"""
+    
+    # Project root directory (parent of src/)
+    BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    DATA_DIR = BASE_DIR / "data"
+    DB_DIR = DATA_DIR / "db"
+    BACKUP_DIR = DATA_DIR / "backups"
+    
+    _dirs_ensured = False
+    
+    @classmethod
+    def ensure_dirs(cls) -> None:
+        """Create the data directories; only hits the filesystem on the first call"""
+        if cls._dirs_ensured:
+            return
+        for directory in (cls.DATA_DIR, cls.DB_DIR, cls.BACKUP_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ensured = True
+        
+    @classmethod
+    def get_db_path(cls, db_name: str = "work_items.db") -> Path:
+        """Location of a database file inside the data directory"""
+        cls.ensure_dirs()
+        return cls.DB_DIR / db_name
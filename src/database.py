@@ -1,39 +1,348 @@
 import sqlite3
+import sys
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict
-import os
+from typing import Iterable, Iterator, List, Optional, Dict
 
-from .models import WorkItem, ItemType, ItemStatus, Priority
+from .config import Config
+from .models import (
+    WorkItem, ItemType, ItemStatus, Priority,
+    ITEM_TYPE_BY_VALUE, STATUS_BY_VALUE, PRIORITY_BY_VALUE, enum_member
+)
+
+def _item_row(item: WorkItem) -> tuple:
+    """Column values for inserting a work item, in work_items column order"""
+    return (
+        item.id,
+        item.title,
+        item.goal,
+        item.item_type.value,
+        item.description,
+        item.priority.value,
+        item.status.value,
+        item.created_at.isoformat(),
+        item.updated_at.isoformat()
+    )
+
+# Explicit column order for work_items SELECTs, so row factories can read by position
+_ITEM_COLUMNS = "id, title, goal, item_type, description, priority, status, created_at, updated_at"
+
+# SQL is built once at import; reusing the same strings keeps every call on
+# the connection's prepared-statement cache instead of re-parsing
+_SQL_INSERT_ITEM = """
+    INSERT INTO work_items (
+        id, title, goal, item_type, description,
+        priority, status, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Rows per multi-row INSERT: keeps 9 binds per row under the historical
+# SQLITE_MAX_VARIABLE_NUMBER default of 999
+_INSERT_CHUNK_ROWS = 999 // 9
+
+# Batches at least this large refresh the planner statistics afterwards
+_ANALYZE_AFTER_ROWS = 1000
+
+@lru_cache(maxsize=None)
+def _sql_insert_items(rows: int) -> str:
+    """A single INSERT with a VALUES tuple for each of `rows` items"""
+    return (
+        "INSERT INTO work_items ("
+        "id, title, goal, item_type, description, "
+        "priority, status, created_at, updated_at"
+        ") VALUES " + ",".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * rows)
+    )
+
+_SQL_UPDATE_ITEM = """
+    UPDATE work_items SET
+        title = ?,
+        goal = ?,
+        item_type = ?,
+        description = ?,
+        priority = ?,
+        status = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+_SQL_DELETE_ITEM = "DELETE FROM work_items WHERE id = ?"
+_SQL_GET_ITEM = f"SELECT {_ITEM_COLUMNS} FROM work_items WHERE id = ?"
+_SQL_GET_ALL_ITEMS = f"SELECT {_ITEM_COLUMNS} FROM work_items"
+_SQL_GET_BY_GOAL = f"""
+    SELECT {_ITEM_COLUMNS} FROM work_items
+    WHERE goal = ? COLLATE NOCASE
+    ORDER BY priority DESC, created_at DESC
+"""
+_SQL_GET_ORDERED_BY_GOAL = f"""
+    SELECT {_ITEM_COLUMNS} FROM work_items
+    ORDER BY goal, priority DESC, created_at DESC
+"""
+_SQL_GET_BY_GOAL_PRIORITY = f"""
+    SELECT {_ITEM_COLUMNS} FROM work_items
+    WHERE goal = ? COLLATE NOCASE
+    ORDER BY priority DESC
+"""
+# The status literal is inlined (not bound) so the planner can match the
+# partial index idx_work_items_incomplete, whose WHERE clause is the same text
+_INCOMPLETE_WHERE = f"status != '{ItemStatus.COMPLETED.value}'"
+_SQL_GET_INCOMPLETE = f"""
+    SELECT {_ITEM_COLUMNS} FROM work_items
+    WHERE {_INCOMPLETE_WHERE}
+    ORDER BY priority DESC, created_at DESC
+"""
+_SQL_GET_BY_TYPE = f"SELECT {_ITEM_COLUMNS} FROM work_items WHERE item_type = ?"
+_SQL_GET_BY_TYPE_AND_GOAL = f"""
+    SELECT {_ITEM_COLUMNS} FROM work_items
+    WHERE item_type = ? AND goal = ? COLLATE NOCASE
+    ORDER BY priority DESC, created_at DESC
+"""
+_SQL_GET_ALL_GOALS = "SELECT DISTINCT goal FROM work_items"
+_SQL_GET_GOAL_SUMMARY = "SELECT goal, count FROM goal_summary"
+_SQL_UPSERT_ENTRY_COUNT = """
+    INSERT INTO entry_counts (goal, count)
+    VALUES (?, ?)
+    ON CONFLICT(goal) DO UPDATE SET count = excluded.count
+"""
+_SQL_GET_ENTRY_COUNT = "SELECT count FROM entry_counts WHERE goal = ?"
+_SQL_GET_ALL_ENTRY_COUNTS = "SELECT goal, count FROM entry_counts"
+_SQL_COUNT_LINK_ENDPOINTS = "SELECT COUNT(1) FROM work_items WHERE id IN (?, ?)"
+_SQL_INSERT_LINK = """
+    INSERT INTO item_links (
+        source_id, target_id, link_type, created_at
+    ) VALUES (?, ?, ?, ?)
+"""
+_SQL_DELETE_LINK = """
+    DELETE FROM item_links
+    WHERE source_id = ? AND target_id = ?
+"""
+# Outgoing and incoming links in one round trip; dir says which bucket a row belongs to
+_SQL_GET_LINKS = """
+    SELECT 'outgoing' AS dir, il.source_id, il.target_id, il.link_type, il.created_at,
+           wi.title, wi.goal, wi.item_type
+    FROM item_links il
+    JOIN work_items wi ON il.target_id = wi.id
+    WHERE il.source_id = ?
+    UNION ALL
+    SELECT 'incoming' AS dir, il.source_id, il.target_id, il.link_type, il.created_at,
+           wi.title, wi.goal, wi.item_type
+    FROM item_links il
+    JOIN work_items wi ON il.source_id = wi.id
+    WHERE il.target_id = ?
+"""
+
+@lru_cache(maxsize=None)
+def _filter_sql(goal: bool, status: bool, priority: bool, item_type: bool) -> str:
+    """
+    SQL for one combination of get_items_by_filters filters, built once per
+    shape. Parameters bind in the order goal, status, priority, item_type.
+    """
+    conditions = []
+    if goal:
+        conditions.append("goal = ? COLLATE NOCASE")
+    if status:
+        conditions.append("status = ?")
+    if priority:
+        conditions.append("priority = ?")
+    if item_type:
+        conditions.append("item_type = ?")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"SELECT {_ITEM_COLUMNS} FROM work_items{where} ORDER BY priority DESC, created_at DESC"
+
+def _filter_query(goal, status, priority, item_type) -> tuple:
+    """SQL and bound parameters for a get_items_by_filters call"""
+    params = []
+    if goal:
+        params.append(goal)
+    if status:
+        params.append(status.value)
+    if priority:
+        params.append(priority.value)
+    if item_type:
+        params.append(item_type.value)
+    return _filter_sql(bool(goal), bool(status), bool(priority), bool(item_type)), params
+
+@lru_cache(maxsize=4096)
+def _parse_dt(value: str) -> datetime:
+    """Parse a stored ISO timestamp; repeated reads of the same rows hit the cache"""
+    return datetime.fromisoformat(value)
+
+def _item_fields(row: tuple) -> dict:
+    """WorkItem field values from a row selected with _ITEM_COLUMNS"""
+    return {
+        'id': row[0],
+        'title': row[1],
+        'goal': row[2],
+        'item_type': enum_member(ITEM_TYPE_BY_VALUE, ItemType, row[3]),
+        'description': row[4],
+        'priority': enum_member(PRIORITY_BY_VALUE, Priority, row[5]),
+        'status': enum_member(STATUS_BY_VALUE, ItemStatus, row[6]),
+        'created_at': _parse_dt(row[7]),
+        'updated_at': _parse_dt(row[8])
+    }
+
+def _workitem_factory(cursor: sqlite3.Cursor, row: tuple) -> WorkItem:
+    """Row factory returning a validated WorkItem straight from the row tuple"""
+    return WorkItem(**_item_fields(row))
+
+def _trusted_workitem_factory(cursor: sqlite3.Cursor, row: tuple) -> WorkItem:
+    """Row factory for rows known to be clean; skips pydantic validation"""
+    return WorkItem.model_construct(**_item_fields(row))
+
+def _fetch_items(conn: sqlite3.Connection, sql: str, params=(),
+                 factory=_workitem_factory) -> List[WorkItem]:
+    """Run a work_items SELECT, decoding rows without the sqlite3.Row -> dict -> from_dict hop"""
+    cursor = conn.cursor()
+    cursor.row_factory = factory
+    return cursor.execute(sql, params).fetchall()
+
+def _iter_items(conn: sqlite3.Connection, sql: str, params=(),
+                factory=_workitem_factory, size: int = 256) -> Iterator[WorkItem]:
+    """Like _fetch_items, but yields WorkItems fetchmany() chunk by chunk"""
+    cursor = conn.cursor()
+    cursor.row_factory = factory
+    cursor.execute(sql, params)
+    try:
+        while True:
+            chunk = cursor.fetchmany(size)
+            if not chunk:
+                return
+            yield from chunk
+    finally:
+        # A caller that stops early leaves the statement unfinished; reset it
+        # now instead of whenever the cursor is garbage collected
+        cursor.close()
+
+# Memory-mapped read window: 256 MB, capped at 64 MB on 32-bit interpreters
+# where address space is scarce
+_MMAP_SIZE = 268435456 if sys.maxsize > 2**32 else 67108864
+
+# Stored in PRAGMA user_version once _create_tables has run; bump it whenever
+# the schema script changes so existing files pick the change up on next open
+_SCHEMA_VERSION = 1
 
 class Database:
     """SQLite database manager for the POS system"""
     
     def __init__(self, db_path: str = "work_items.db"):
         """Initialize database connection and create tables if they don't exist"""
-        # Get the absolute path of the project root directory
-        self.base_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_dir = self.base_dir / "data" / "db"
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = self.data_dir / db_path
-        self._create_tables()
+        self.base_dir = Config.BASE_DIR
+        self.data_dir = Config.DB_DIR
+        self.db_path = Config.get_db_path(db_path)
+        # String form used for every connect, computed once
+        self.db_path_str = str(self.db_path)
+        # One long-lived connection per thread, reused by every call
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        """
+        Bring the file up to this version's schema and journal mode; a no-op
+        when user_version is current. Call again after the file is replaced
+        underneath this object (e.g. by a backup restore).
+        """
+        if not self._schema_is_current():
+            self._enable_wal()
+            self._create_tables()
+            
+    def _schema_is_current(self) -> bool:
+        """Whether the file already has this version's tables, indexes and journal mode"""
+        with self.get_connection() as conn:
+            return (
+                conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+                and conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            )
+        
+    def _enable_wal(self):
+        """
+        Switch the database to write-ahead logging. The journal mode is stored
+        in the database file, so this only needs to happen once per file.
+        """
+        with self.get_connection() as conn:
+            # Must come before the file is first written: these only take effect
+            # on a fresh database. Existing files keep their page size and switch
+            # auto_vacuum over on their next full VACUUM (see execute_vacuum)
+            conn.execute("PRAGMA page_size=8192")  # wider b-tree fanout, fewer page reads
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        """Per-connection performance settings (these do not persist in the file)"""
+        conn.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, fsyncs only at checkpoints
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # ~64 MB page cache
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA analysis_limit=1000")  # bounds ANALYZE / optimize cost
+        
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection for the calling thread"""
+        conn = sqlite3.connect(
+            self.db_path_str, check_same_thread=False, cached_statements=256,
+            isolation_level=None  # autocommit; multi-statement writes use transaction()
+        )
+        self._apply_pragmas(conn)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
         
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """
+        Context manager yielding this thread's cached connection. The connection
+        stays open across calls so SQLite's page and statement caches stay warm.
+        Connections are in autocommit mode, so the only open transactions are
+        the ones transaction() starts, and it alone rolls them back.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        yield conn
+            
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one IMMEDIATE transaction, committed on exit
+        and rolled back on error. Nested use joins the outer transaction, and
+        single-write methods (add_item, update_entry_count, ...) called inside
+        the block run in it instead of committing on their own.
+        """
+        with self.get_connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                # SQLite may already have rolled back (e.g. on SQLITE_FULL)
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            
+    def close(self) -> None:
+        """Close all cached connections, refreshing planner statistics first"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
             
     def _create_tables(self):
         """Create necessary database tables and indexes"""
         with self.get_connection() as conn:
             # Create tables with appropriate indexes
-            conn.executescript("""
+            conn.executescript(f"""
                 CREATE TABLE IF NOT EXISTS work_items (
                     id TEXT PRIMARY KEY,
                     title TEXT NOT NULL,
@@ -50,8 +359,12 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_work_items_goal 
                 ON work_items(goal);
                 
-                CREATE INDEX IF NOT EXISTS idx_work_items_status 
-                ON work_items(status);
+                -- Status filters, already in the usual priority/created_at output order
+                CREATE INDEX IF NOT EXISTS idx_work_items_status_pri_created 
+                ON work_items(status, priority DESC, created_at DESC);
+                
+                -- Prefix of the composite index above
+                DROP INDEX IF EXISTS idx_work_items_status;
                 
                 CREATE INDEX IF NOT EXISTS idx_work_items_priority 
                 ON work_items(priority);
@@ -63,10 +376,24 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_work_items_goal_priority_created 
                 ON work_items(goal, priority DESC, created_at DESC);
                 
+                -- Case-insensitive goal lookups (goal = ? COLLATE NOCASE), already
+                -- in output order so no sort step is needed
+                CREATE INDEX IF NOT EXISTS idx_work_items_goal_nocase_prio_created 
+                ON work_items(goal COLLATE NOCASE, priority DESC, created_at DESC);
+                
+                -- Partial index holding only incomplete items, in output order
+                CREATE INDEX IF NOT EXISTS idx_work_items_incomplete 
+                ON work_items(priority DESC, created_at DESC) WHERE {_INCOMPLETE_WHERE};
+                
+                -- Live number of items per goal, answered from idx_work_items_goal
+                CREATE VIEW IF NOT EXISTS goal_summary AS
+                SELECT goal, COUNT(*) AS count FROM work_items GROUP BY goal;
+                
+                -- Two-column lookup table keyed by goal: no rowid b-tree needed
                 CREATE TABLE IF NOT EXISTS entry_counts (
                     goal TEXT PRIMARY KEY,
                     count INTEGER NOT NULL
-                );
+                ) WITHOUT ROWID;
                 
                 -- Create item_links table for relationships between items
                 CREATE TABLE IF NOT EXISTS item_links (
@@ -79,69 +406,40 @@ class Database:
                     FOREIGN KEY (target_id) REFERENCES work_items(id)
                 );
                 
-                -- Create indexes for item_links table
-                CREATE INDEX IF NOT EXISTS idx_item_links_source 
-                ON item_links(source_id);
+                -- Covering indexes for item_links lookups from either end, so
+                -- get_links reads link_type/created_at without touching the table
+                CREATE INDEX IF NOT EXISTS idx_item_links_src_cov 
+                ON item_links(source_id, target_id, link_type, created_at);
                 
-                CREATE INDEX IF NOT EXISTS idx_item_links_target 
-                ON item_links(target_id);
+                CREATE INDEX IF NOT EXISTS idx_item_links_tgt_cov 
+                ON item_links(target_id, source_id, link_type, created_at);
+                
+                -- Superseded by the covering indexes above
+                DROP INDEX IF EXISTS idx_item_links_source;
+                DROP INDEX IF EXISTS idx_item_links_target;
                 
                 CREATE INDEX IF NOT EXISTS idx_item_links_type 
                 ON item_links(link_type);
             """)
             
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON;")
-            conn.commit()
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             
     def add_item(self, item: WorkItem) -> None:
         """Add a new work item to the database"""
         with self.get_connection() as conn:
-            conn.execute("""
-                INSERT INTO work_items (
-                    id, title, goal, item_type, description,
-                    priority, status, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                item.id,
-                item.title,
-                item.goal,
-                item.item_type.value,
-                item.description,
-                item.priority.value,
-                item.status.value,
-                item.created_at.isoformat(),
-                item.updated_at.isoformat()
-            ))
-            conn.commit()
+            conn.execute(_SQL_INSERT_ITEM, _item_row(item))
             
     def get_item(self, item_id: str) -> Optional[WorkItem]:
         """Retrieve a work item by its ID"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM work_items WHERE id = ?",
-                (item_id,)
-            )
-            row = cursor.fetchone()
+            items = _fetch_items(conn, _SQL_GET_ITEM, (item_id,))
             
-        if row:
-            return WorkItem.from_dict(dict(row))
-        return None
+        return items[0] if items else None
         
     def update_item(self, item: WorkItem) -> None:
         """Update an existing work item"""
         with self.get_connection() as conn:
-            conn.execute("""
-                UPDATE work_items SET
-                    title = ?,
-                    goal = ?,
-                    item_type = ?,
-                    description = ?,
-                    priority = ?,
-                    status = ?,
-                    updated_at = ?
-                WHERE id = ?
-            """, (
+            conn.execute(_SQL_UPDATE_ITEM, (
                 item.title,
                 item.goal,
                 item.item_type.value,
@@ -151,46 +449,31 @@ class Database:
                 item.updated_at.isoformat(),
                 item.id
             ))
-            conn.commit()
             
     def get_items_by_goal(self, goal: str) -> List[WorkItem]:
         """Optimized query for getting items by goal"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM work_items 
-                WHERE LOWER(goal) = LOWER(?) 
-                ORDER BY priority DESC, created_at DESC
-                """,
-                (goal,)
-            )
-            return [WorkItem.from_dict(dict(row)) for row in cursor.fetchall()]
+            return _fetch_items(conn, _SQL_GET_BY_GOAL, (goal,))
+
+    def get_items_ordered_by_goal(self) -> List[WorkItem]:
+        """Get all items in one query, ordered by goal, priority and creation time"""
+        with self.get_connection() as conn:
+            return _fetch_items(conn, _SQL_GET_ORDERED_BY_GOAL)
 
     def get_items_by_goal_priority(self, goal: str) -> List[WorkItem]:
         """Optimized query for getting items by goal and priority"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM work_items 
-                WHERE LOWER(goal) = LOWER(?) 
-                ORDER BY priority DESC
-                """,
-                (goal,)
-            )
-            return [WorkItem.from_dict(dict(row)) for row in cursor.fetchall()]
+            return _fetch_items(conn, _SQL_GET_BY_GOAL_PRIORITY, (goal,))
 
     def get_incomplete_items(self) -> List[WorkItem]:
         """Optimized query for getting incomplete items"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM work_items 
-                WHERE status != ? 
-                ORDER BY priority DESC, created_at DESC
-                """,
-                (ItemStatus.COMPLETED.value,)
-            )
-            return [WorkItem.from_dict(dict(row)) for row in cursor.fetchall()]
+            return _fetch_items(conn, _SQL_GET_INCOMPLETE)
+
+    def iter_incomplete_items(self) -> Iterator[WorkItem]:
+        """Streaming counterpart of get_incomplete_items"""
+        with self.get_connection() as conn:
+            yield from _iter_items(conn, _SQL_GET_INCOMPLETE)
 
     def get_items_by_filters(self, 
                            goal: Optional[str] = None,
@@ -198,105 +481,129 @@ class Database:
                            priority: Optional[Priority] = None,
                            item_type: Optional[ItemType] = None) -> List[WorkItem]:
         """Flexible query with multiple optional filters"""
-        query = ["SELECT * FROM work_items WHERE 1=1"]
-        params = []
-
-        if goal:
-            query.append("AND LOWER(goal) = LOWER(?)")
-            params.append(goal)
-        if status:
-            query.append("AND status = ?")
-            params.append(status.value)
-        if priority:
-            query.append("AND priority = ?")
-            params.append(priority.value)
-        if item_type:
-            query.append("AND item_type = ?")
-            params.append(item_type.value)
-
-        query.append("ORDER BY priority DESC, created_at DESC")
-        
+        sql, params = _filter_query(goal, status, priority, item_type)
         with self.get_connection() as conn:
-            cursor = conn.execute(" ".join(query), params)
-            return [WorkItem.from_dict(dict(row)) for row in cursor.fetchall()]
+            return _fetch_items(conn, sql, params)
 
-    def batch_insert_items(self, items: List[WorkItem]) -> None:
-        """Batch insert multiple items efficiently"""
+    def iter_items_by_filters(self,
+                              goal: Optional[str] = None,
+                              status: Optional[ItemStatus] = None,
+                              priority: Optional[Priority] = None,
+                              item_type: Optional[ItemType] = None) -> Iterator[WorkItem]:
+        """Streaming counterpart of get_items_by_filters"""
+        sql, params = _filter_query(goal, status, priority, item_type)
         with self.get_connection() as conn:
-            conn.executemany(
-                """
-                INSERT INTO work_items (
-                    id, title, goal, item_type, description,
-                    priority, status, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [(
-                    item.id,
-                    item.title,
-                    item.goal,
-                    item.item_type.value,
-                    item.description,
-                    item.priority.value,
-                    item.status.value,
-                    item.created_at.isoformat(),
-                    item.updated_at.isoformat()
-                ) for item in items]
-            )
-            conn.commit()
+            yield from _iter_items(conn, sql, params)
+
+    def batch_insert_items(self, items: Iterable[WorkItem]) -> None:
+        """
+        Batch insert multiple items efficiently: one explicit transaction
+        (a single commit for the whole batch), with rows streamed in chunks
+        of multi-row INSERT statements instead of materialized as a list first
+        """
+        self.batch_insert_rows(map(_item_row, items))
+
+    def batch_insert_rows(self, rows: Iterable[tuple]) -> None:
+        """
+        Like batch_insert_items, but takes ready-made column tuples in
+        work_items column order (see _item_row), for bulk loads that never
+        need WorkItem objects
+        """
+        with self.transaction() as conn:
+            if self.insert_rows(conn, rows) >= _ANALYZE_AFTER_ROWS:
+                conn.execute("ANALYZE")
+
+    @staticmethod
+    def insert_rows(conn: sqlite3.Connection, rows: Iterable[tuple]) -> int:
+        """
+        Insert work_items column tuples on conn (e.g. the one transaction()
+        yielded) in multi-row chunks, without opening a transaction of its
+        own. Returns the number of rows inserted.
+        """
+        rows = iter(rows)
+        inserted = 0
+        while True:
+            chunk = list(islice(rows, _INSERT_CHUNK_ROWS))
+            if not chunk:
+                return inserted
+            conn.execute(_sql_insert_items(len(chunk)), list(chain.from_iterable(chunk)))
+            inserted += len(chunk)
+
+    def delete_items(self, item_ids: Iterable[str]) -> None:
+        """Delete several work items by ID in a single transaction"""
+        with self.transaction() as conn:
+            conn.executemany(_SQL_DELETE_ITEM, ((item_id,) for item_id in item_ids))
 
     def execute_vacuum(self) -> None:
-        """Optimize database by removing unused space"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("VACUUM")
+        """
+        Optimize database by removing unused space. Reclaims free pages
+        incrementally when the file uses auto_vacuum=INCREMENTAL; older files
+        get one full VACUUM, which also converts them to incremental mode.
+        """
+        with self.get_connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+            else:
+                # Changing auto_vacuum on an existing file only takes effect
+                # through the VACUUM that follows
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            conn.execute("PRAGMA optimize")
             
     def get_items_by_type(self, item_type: ItemType) -> List[WorkItem]:
         """Get all items of a specific type"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM work_items WHERE item_type = ?",
-                (item_type.value,)
-            )
-            return [WorkItem.from_dict(dict(row)) for row in cursor.fetchall()]
+            return _fetch_items(conn, _SQL_GET_BY_TYPE, (item_type.value,))
+            
+    def get_items_by_type_and_goal(self, item_type: ItemType, goal: str) -> List[WorkItem]:
+        """Get items of a specific type for a goal (goal matched case-insensitively)"""
+        with self.get_connection() as conn:
+            return _fetch_items(conn, _SQL_GET_BY_TYPE_AND_GOAL, (item_type.value, goal))
             
     def get_all_goals(self) -> List[str]:
         """Get a list of all unique goals"""
         with self.get_connection() as conn:
-            cursor = conn.execute("SELECT DISTINCT goal FROM work_items")
+            cursor = conn.execute(_SQL_GET_ALL_GOALS)
             return [row[0] for row in cursor.fetchall()]
             
-    def get_all_items(self) -> Dict[str, WorkItem]:
-        """Get all work items as a dictionary keyed by ID"""
+    def iter_all_items(self, validate: bool = True) -> Iterator[WorkItem]:
+        """Stream all work items without materializing the full result set"""
+        factory = _workitem_factory if validate else _trusted_workitem_factory
         with self.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM work_items")
-            return {
-                row['id']: WorkItem.from_dict(dict(row))
-                for row in cursor.fetchall()
-            }
+            yield from _iter_items(conn, _SQL_GET_ALL_ITEMS, factory=factory)
+            
+    def get_goal_summary(self) -> Dict[str, int]:
+        """Get every goal with its current item count in one query"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_GET_GOAL_SUMMARY)
+            return {row[0]: row[1] for row in cursor.fetchall()}
+            
+    def get_all_items(self, validate: bool = True) -> Dict[str, WorkItem]:
+        """Get all work items as a dictionary keyed by ID"""
+        return {item.id: item for item in self.iter_all_items(validate)}
             
     def update_entry_count(self, goal: str, count: int) -> None:
         """Update the entry count for a goal"""
         with self.get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO entry_counts (goal, count)
-                VALUES (?, ?)
-            """, (goal, count))
-            conn.commit()
+            conn.execute(_SQL_UPSERT_ENTRY_COUNT, (goal, count))
+            
+    def bulk_update_entry_counts(self, counts: Dict[str, int]) -> None:
+        """Upsert many entry counts in a single transaction"""
+        with self.transaction() as conn:
+            conn.executemany(_SQL_UPSERT_ENTRY_COUNT, counts.items())
             
     def get_entry_count(self, goal: str) -> int:
         """Get the entry count for a goal"""
         with self.get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT count FROM entry_counts WHERE goal = ?",
-                (goal,)
-            )
+            cursor = conn.execute(_SQL_GET_ENTRY_COUNT, (goal,))
             row = cursor.fetchone()
             return row[0] if row else 0
             
     def get_all_entry_counts(self) -> Dict[str, int]:
         """Get all entry counts as a dictionary"""
         with self.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM entry_counts")
-            return {row['goal']: row['count'] for row in cursor.fetchall()}
+            cursor = conn.execute(_SQL_GET_ALL_ENTRY_COUNTS)
+            return dict(cursor.fetchall())
 
     def add_link(self, source_id: str, target_id: str, link_type: str = "references") -> bool:
         """
@@ -311,23 +618,19 @@ class Database:
             bool: True if the link was added successfully, False otherwise
         """
         try:
-            # Check if both items exist
-            if not self.get_item(source_id) or not self.get_item(target_id):
-                return False
-                
-            # Insert the link
             with self.get_connection() as conn:
-                conn.execute("""
-                    INSERT INTO item_links (
-                        source_id, target_id, link_type, created_at
-                    ) VALUES (?, ?, ?, ?)
-                """, (
+                # Check both items exist in one query, without decoding them
+                cursor = conn.execute(_SQL_COUNT_LINK_ENDPOINTS, (source_id, target_id))
+                if cursor.fetchone()[0] != len({source_id, target_id}):
+                    return False
+                    
+                # Insert the link
+                conn.execute(_SQL_INSERT_LINK, (
                     source_id,
                     target_id,
                     link_type,
                     datetime.now().isoformat()
                 ))
-                conn.commit()
             return True
         except sqlite3.Error as e:
             print(f"Error adding link: {e}")
@@ -346,11 +649,7 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    DELETE FROM item_links
-                    WHERE source_id = ? AND target_id = ?
-                """, (source_id, target_id))
-                conn.commit()
+                cursor = conn.execute(_SQL_DELETE_LINK, (source_id, target_id))
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             print(f"Error removing link: {e}")
@@ -373,44 +672,18 @@ class Database:
         
         try:
             with self.get_connection() as conn:
-                # Get outgoing links (item_id is the source)
-                outgoing_cursor = conn.execute("""
-                    SELECT il.source_id, il.target_id, il.link_type, il.created_at,
-                           wi.title, wi.goal, wi.item_type
-                    FROM item_links il
-                    JOIN work_items wi ON il.target_id = wi.id
-                    WHERE il.source_id = ?
-                """, (item_id,))
-                
-                for row in outgoing_cursor.fetchall():
-                    result['outgoing'].append({
-                        'source_id': row['source_id'],
-                        'target_id': row['target_id'],
-                        'link_type': row['link_type'],
-                        'created_at': row['created_at'],
-                        'title': row['title'],
-                        'goal': row['goal'],
-                        'item_type': row['item_type']
-                    })
-                
-                # Get incoming links (item_id is the target)
-                incoming_cursor = conn.execute("""
-                    SELECT il.source_id, il.target_id, il.link_type, il.created_at,
-                           wi.title, wi.goal, wi.item_type
-                    FROM item_links il
-                    JOIN work_items wi ON il.source_id = wi.id
-                    WHERE il.target_id = ?
-                """, (item_id,))
+                cursor = conn.execute(_SQL_GET_LINKS, (item_id, item_id))
                 
-                for row in incoming_cursor.fetchall():
-                    result['incoming'].append({
-                        'source_id': row['source_id'],
-                        'target_id': row['target_id'],
-                        'link_type': row['link_type'],
-                        'created_at': row['created_at'],
-                        'title': row['title'],
-                        'goal': row['goal'],
-                        'item_type': row['item_type']
+                for (direction, source_id, target_id, link_type, created_at,
+                     title, goal, item_type) in cursor.fetchall():
+                    result[direction].append({
+                        'source_id': source_id,
+                        'target_id': target_id,
+                        'link_type': link_type,
+                        'created_at': created_at,
+                        'title': title,
+                        'goal': goal,
+                        'item_type': item_type
                     })
                     
             return result
@@ -1,15 +1,99 @@
-from rich.console import Console
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
-from typing import List
+from typing import Dict, List, Optional
 
 from .models import WorkItem, ItemType, Priority, ItemStatus
 
+# Cell styles keyed by enum member; the enums are closed, so lookups can't miss
+PRIORITY_COLOR = {
+    Priority.HI: "bright_red",
+    Priority.MED: "yellow",
+    Priority.LOW: "green"
+}
+STATUS_COLOR = {
+    ItemStatus.COMPLETED: "green",
+    ItemStatus.IN_PROGRESS: "yellow",
+    ItemStatus.NOT_STARTED: "red"
+}
+TYPE_STYLE = {t: "bold cyan" if t == ItemType.THOUGHT else "" for t in ItemType}
+TITLE_STYLE = {t: "italic" if t == ItemType.THOUGHT else "" for t in ItemType}
+
+# Colors for link relationship types in the link tree
+LINK_TYPE_COLORS = {
+    "references": "blue",
+    "evolves-from": "green",
+    "inspired-by": "yellow",
+    "parent-child": "magenta"
+}
+
+# Tree branches list priorities highest first
+PRIORITIES_DESC = tuple(reversed(Priority))
+
+# Fully formatted markup for tree labels, built once at import
+PRIORITY_BRANCH_MARKUP = {
+    p: f"[{c}]{p.name} Priority[/{c}]" for p, c in PRIORITY_COLOR.items()
+}
+STATUS_MARKUP = {s: f"[{c}]{s.value}[/{c}]" for s, c in STATUS_COLOR.items()}
+TYPE_BRANCH_MARKUP = {
+    t: f"[bold cyan]{t.name}[/bold cyan]" if t == ItemType.THOUGHT
+    else f"[bold yellow]{t.name}[/bold yellow]"
+    for t in ItemType
+}
+
+@lru_cache(maxsize=4096)
+def _format_minute(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """'%Y-%m-%d %H:%M' for one minute; items created in the same minute share it"""
+    return datetime(year, month, day, hour, minute).strftime('%Y-%m-%d %H:%M')
+
+def _format_created(ts: datetime) -> str:
+    """Minute-resolution timestamp shown in item tables"""
+    return _format_minute(ts.year, ts.month, ts.day, ts.hour, ts.minute)
+
 class Display:
     """Handles all display formatting and UI elements using Rich library"""
     
     def __init__(self):
-        self.console = Console(force_terminal=True)
+        # Let Rich detect the terminal: piped or redirected output gets plain
+        # text instead of ANSI escapes (FORCE_COLOR still forces styling)
+        self.console = Console()
+        # Message lines queued inside batched(); None when printing directly
+        self._line_buffer: Optional[List[str]] = None
+
+    @contextmanager
+    def batched(self):
+        """
+        Queue print_success/print_error/print_warning/print messages and
+        render them with a single console.print when the block exits
+        """
+        if self._line_buffer is not None:
+            yield
+            return
+        self._line_buffer = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._line_buffer = None
+
+    def flush(self):
+        """Print any queued message lines in one call"""
+        if self._line_buffer:
+            self.console.print("\n".join(self._line_buffer))
+            self._line_buffer.clear()
+
+    def _write(self, markup: str):
+        """Print a message line now, or queue it while batching"""
+        if self._line_buffer is None:
+            self.console.print(markup)
+        else:
+            self._line_buffer.append(markup)
 
     def print_items(self, items: List[WorkItem]):
         """Pretty-print a list of work items as a table"""
@@ -17,6 +101,19 @@ class Display:
             self.print_warning("No items to display.")
             return
             
+        self.console.print(self._build_items_table(items))
+
+    def print_items_grouped(self, groups: Dict[str, List[WorkItem]]):
+        """Pretty-print one table per group (e.g. per goal) in a single render pass"""
+        tables = [self._build_items_table(items) for items in groups.values() if items]
+        if not tables:
+            self.print_warning("No items to display.")
+            return
+            
+        self.console.print(Group(*tables))
+
+    def _build_items_table(self, items: List[WorkItem]) -> Table:
+        """Build the Rich table used to display a list of work items"""
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Goal", style="blue")
@@ -27,42 +124,20 @@ class Display:
         table.add_column("Created", style="white")
         table.add_column("Description", style="white")
         
+        # Cells are pre-styled Text objects, so Rich has no markup to parse per row;
+        # thoughts get highlighted type and italic title styles
         for item in items:
-            # Set priority color
-            priority_color = {
-                Priority.HI: "bright_red",
-                Priority.MED: "yellow",
-                Priority.LOW: "green"
-            }.get(item.priority, "white")
-            
-            # Set status color
-            status_color = {
-                ItemStatus.COMPLETED: "green",
-                ItemStatus.IN_PROGRESS: "yellow",
-                ItemStatus.NOT_STARTED: "red"
-            }.get(item.status, "white")
-            
-            # Set type styling - add special highlight for thoughts
-            type_display = item.item_type.value
-            if item.item_type == ItemType.THOUGHT:
-                type_display = f"[bold cyan]{type_display}[/bold cyan]"
-            
-            # Set title styling - add special highlight for thoughts
-            title_display = item.title
-            if item.item_type == ItemType.THOUGHT:
-                title_display = f"[italic]{title_display}[/italic]"
-            
             table.add_row(
-                item.id,
-                item.goal,
-                title_display,
-                type_display,
-                f"[{priority_color}]{item.priority.name}[/{priority_color}]",
-                f"[{status_color}]{item.status.value}[/{status_color}]",
-                item.created_at.strftime('%Y-%m-%d %H:%M'),
-                item.description
+                Text(item.id),
+                Text(item.goal),
+                Text(item.title, style=TITLE_STYLE[item.item_type]),
+                Text(item.item_type.value, style=TYPE_STYLE[item.item_type]),
+                Text(item.priority.name, style=PRIORITY_COLOR[item.priority]),
+                Text(item.status.value, style=STATUS_COLOR[item.status]),
+                Text(_format_created(item.created_at)),
+                Text(item.description)
             )
-        self.console.print(table)
+        return table
 
     def print_tree(self, items: List[WorkItem], goals: List[str]):
         """Display a hierarchical tree view of goals and their work items"""
@@ -72,68 +147,61 @@ class Display:
             self.console.print("[bold yellow]No goals/items to display.[/bold yellow]")
             return
         
+        # One pass buckets every item by (goal, type, priority); the loops
+        # below only visit buckets that exist
+        buckets = defaultdict(list)
+        for item in items:
+            buckets[(item.goal.lower(), item.item_type, item.priority)].append(item)
+        
+        goals_with_items = {goal_key for goal_key, _, _ in buckets}
+        
         for goal in goals:
+            # Stale goals with no items get no (empty) branch
+            goal_key = goal.lower()
+            if goal_key not in goals_with_items:
+                continue
             goal_branch = tree.add(f"[bold blue]{goal.upper()}[/bold blue]")
-            goal_items = [item for item in items if item.goal.lower() == goal.lower()]
             
             # Group items by type
             for item_type in ItemType:
-                type_items = [item for item in goal_items if item.item_type == item_type]
-                if not type_items:
+                type_buckets = [
+                    (priority, buckets[(goal_key, item_type, priority)])
+                    for priority in PRIORITIES_DESC
+                    if (goal_key, item_type, priority) in buckets
+                ]
+                if not type_buckets:
                     continue
                 
-                # Use a special styling for THOUGHT type
-                if item_type == ItemType.THOUGHT:
-                    type_branch = goal_branch.add(f"[bold cyan]{item_type.name}[/bold cyan]")
-                else:
-                    type_branch = goal_branch.add(f"[bold yellow]{item_type.name}[/bold yellow]")
+                # THOUGHT branches get their own highlight
+                type_branch = goal_branch.add(TYPE_BRANCH_MARKUP[item_type])
                 
-                # Sort items by priority (high to low)
-                sorted_items = sorted(type_items, key=lambda x: (x.priority.value, x.created_at), reverse=True)
-                
-                # Group by priority
-                for priority in reversed(list(Priority)):
-                    priority_items = [item for item in sorted_items if item.priority == priority]
-                    if not priority_items:
-                        continue
-                        
-                    priority_color = {
-                        Priority.HI: "bright_red",
-                        Priority.MED: "yellow",
-                        Priority.LOW: "green"
-                    }.get(priority, "white")
-                    
-                    priority_branch = type_branch.add(f"[{priority_color}]{priority.name} Priority[/{priority_color}]")
+                # Group by priority (high to low), newest first within each
+                for priority, priority_items in type_buckets:
+                    priority_branch = type_branch.add(PRIORITY_BRANCH_MARKUP[priority])
                     
-                    for item in priority_items:
-                        status_color = {
-                            ItemStatus.COMPLETED: "green",
-                            ItemStatus.IN_PROGRESS: "yellow",
-                            ItemStatus.NOT_STARTED: "red"
-                        }.get(item.status, "white")
-                        
+                    for item in sorted(priority_items, key=attrgetter('created_at'), reverse=True):
                         priority_branch.add(
                             f"[cyan]{item.id}[/cyan] - {item.title} "
-                            f"([{status_color}]{item.status.value}[/{status_color}])"
+                            f"({STATUS_MARKUP[item.status]})"
                         )
         
         self.console.print(tree)
 
     def print_success(self, message: str):
         """Print a success message"""
-        self.console.print(f"[bold green]{message}[/bold green]")
+        self._write(f"[bold green]{message}[/bold green]")
 
     def print_error(self, message: str):
         """Print an error message"""
-        self.console.print(f"[bold red]Error:[/bold red] {message}")
+        self._write(f"[bold red]Error:[/bold red] {message}")
 
     def print_warning(self, message: str):
         """Print a warning message"""
-        self.console.print(f"[bold yellow]{message}[/bold yellow]")
+        self._write(f"[bold yellow]{message}[/bold yellow]")
 
     def print(self, message: str):
         """Print a formatted message"""
-        self.console.print(message)
+        self._write(message)
 
     def print_link_tree(self, items: dict, root_id: str = None, max_depth: int = 5):
         """
@@ -155,14 +223,30 @@ class Display:
         # Track visited items to handle cycles
         visited = set()
         
-        # Function to recursively build the tree
+        # Subtrees already rendered for (item_id, depth). Shared link targets
+        # reuse them instead of being expanded again from every parent; only
+        # subtrees that are fully expanded and never hit a cycle marker are
+        # cached, since those are the same whichever path reaches them. A
+        # subtree cut off by max_depth is not: past the cut, a node may be a
+        # cycle reference on another path.
+        subtree_cache = {}
+        
+        # Function to recursively build the tree. Returns True when the
+        # subtree depends on the current path (it contains a cycle reference
+        # or was truncated at max_depth).
         def build_tree(tree_node, item_id, depth=0):
             # Prevent infinite recursion due to cycles
             if depth > max_depth or item_id in visited:
                 if item_id in visited:
                     # Mark as a cycle reference
                     tree_node.add(f"[dim cyan]{item_id}[/dim cyan] [dim](cycle reference)[/dim]")
-                return
+                    return True
+                return False
+                
+            cached = subtree_cache.get((item_id, depth))
+            if cached is not None:
+                tree_node.children.append(cached)
+                return False
 
             # Mark as visited to handle cycles
             visited.add(item_id)
@@ -170,17 +254,10 @@ class Display:
             # Get the item and its links
             if item_id not in items:
                 tree_node.add(f"[red]Item not found: {item_id}[/red]")
-                return
+                return True
                 
             item, links = items[item_id]
-            
-            # Define colors for different link types
-            link_type_colors = {
-                "references": "blue",
-                "evolves-from": "green",
-                "inspired-by": "yellow",
-                "parent-child": "magenta"
-            }
+            path_dependent = False
             
             # Format the item node based on its type
             item_title = f"[cyan]{item.id}[/cyan] - "
@@ -210,7 +287,7 @@ class Display:
                 # Process each link type
                 for link_type, type_links in links_by_type.items():
                     # Get color for this link type
-                    color = link_type_colors.get(link_type, "white")
+                    color = LINK_TYPE_COLORS.get(link_type, "white")
                     
                     # Create a node for this link type
                     type_node = outgoing_node.add(f"[{color}]{link_type}[/{color}] ({len(type_links)})")
@@ -226,12 +303,19 @@ class Display:
                             )
                             # Recursively build the tree for this target (deeper level)
                             if depth < max_depth:
-                                build_tree(target_node, target_id, depth + 1)
+                                if build_tree(target_node, target_id, depth + 1):
+                                    path_dependent = True
+                            else:
+                                path_dependent = True
                         else:
                             type_node.add(f"[red]Target not found: {target_id}[/red]")
             
             # Remove from visited when backtracking
             visited.remove(item_id)
+            
+            if not path_dependent:
+                subtree_cache[(item_id, depth)] = item_node
+            return path_dependent
         
         # If a root is specified, build tree from that item
         if root_id:
@@ -1,87 +1,191 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import json
+import re
+from sys import intern
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import sqlite3
 
-from .models import WorkItem, ItemType, ItemStatus, Priority
+try:
+    import ijson
+except ImportError:  # optional: only used to stream very large JSON files
+    ijson = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: faster parsing of whole-file loads
+    from json import loads as _json_loads
+
+from .models import ITEM_TYPE_BY_VALUE, PRIORITY_BY_VALUE, STATUS_BY_VALUE
 from .database import Database
 from .backup import BackupManager
 
+_ENUM_FIELDS = (
+    ('item_type', ITEM_TYPE_BY_VALUE),
+    ('priority', PRIORITY_BY_VALUE),
+    ('status', STATUS_BY_VALUE),
+)
+
+
+def _lookup_member(members: Dict[Any, Any], value: Any):
+    """Return the enum member for a raw JSON value, or None if it is not valid"""
+    try:
+        return members.get(value)
+    except TypeError:  # unhashable JSON values (lists, objects)
+        return None
+
+
+class _ValidationFailed(Exception):
+    """Raised inside the migration transaction to roll it back"""
+
+# JSON files larger than this are stream-parsed when ijson is installed
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Accepted timestamp layouts, matched in one pass:
+#   %Y-%m-%dT%H:%M:%S[.%f]  and  %Y-%m-%d %H:%M[:%S]
+_TIMESTAMP_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'(?:T(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,6}))?'
+    r'| (\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)'
+)
+
 class MigrationManager:
-    def __init__(self, json_path: str = "work_items.json", db_path: str = "work_items.db"):
+    def __init__(self, json_path: str = "work_items.json", db_path: str = "work_items.db",
+                 db: Optional[Database] = None, backup_manager: Optional[BackupManager] = None):
+        """
+        Pass db and backup_manager to migrate through objects that are already
+        open on db_path (e.g. the CLI's WorkSystem) instead of opening new ones
+        """
         self.json_path = Path(json_path)
         self.db_path = Path(db_path)
-        self.backup_manager = BackupManager(db_path)
-        self.db = Database(db_path)
+        self.backup_manager = backup_manager if backup_manager is not None else BackupManager(db_path)
+        self.db = db if db is not None else Database(db_path)
 
     def validate_json_data(self, data: Dict[str, Any]) -> List[str]:
         """Validate JSON data format and content"""
-        errors = []
-        
         # Check basic structure
         if isinstance(data, dict) and 'items' in data:
             items_dict = data['items']
         else:
             items_dict = data
             
-        # Validate each item
-        for item_id, item_data in items_dict.items():
-            try:
-                # Check required fields
-                required_fields = ['title', 'item_type', 'description', 'status']
-                missing_fields = [f for f in required_fields if f not in item_data]
-                if missing_fields:
-                    errors.append(f"Item {item_id} missing fields: {', '.join(missing_fields)}")
-                    continue
-                
-                # Validate enum values
-                if 'item_type' in item_data:
-                    try:
-                        ItemType(item_data['item_type'])
-                    except ValueError:
-                        errors.append(f"Item {item_id} has invalid item_type: {item_data['item_type']}")
-                
-                if 'priority' in item_data:
-                    try:
-                        Priority(item_data['priority'])
-                    except ValueError:
-                        errors.append(f"Item {item_id} has invalid priority: {item_data['priority']}")
-                
-                if 'status' in item_data:
+        return self._validate_items(items_dict.items())
+
+    def _validate_items(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Validate (item_id, item_data) pairs, returning a list of errors"""
+        errors = []
+        for item_id, item_data in items:
+            errors.extend(self._check_item(item_id, item_data)[1])
+        return errors
+
+    def _check_item(self, item_id: str, item_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Validate one item. Returns the converted enum and timestamp fields
+        alongside any errors, so migration can build the row from them
+        instead of converting every field a second time.
+        """
+        fields = {}
+        errors = []
+        try:
+            # Check required fields
+            required_fields = ['title', 'item_type', 'description', 'status']
+            missing_fields = [f for f in required_fields if f not in item_data]
+            if missing_fields:
+                errors.append(f"Item {item_id} missing fields: {', '.join(missing_fields)}")
+                return fields, errors
+            
+            # Validate enum values with a dict lookup rather than raising
+            # and catching ValueError from the Enum constructor per item
+            for name, members in _ENUM_FIELDS:
+                if name in item_data:
+                    member = _lookup_member(members, item_data[name])
+                    if member is None:
+                        errors.append(f"Item {item_id} has invalid {name}: {item_data[name]}")
+                    else:
+                        fields[name] = member
+            
+            # Validate timestamps
+            for timestamp_field in ['created_at', 'updated_at']:
+                if timestamp_field in item_data:
                     try:
-                        ItemStatus(item_data['status'])
+                        fields[timestamp_field] = self._parse_timestamp(item_data[timestamp_field])
                     except ValueError:
-                        errors.append(f"Item {item_id} has invalid status: {item_data['status']}")
-                
-                # Validate timestamps
-                for timestamp_field in ['created_at', 'updated_at']:
-                    if timestamp_field in item_data:
-                        try:
-                            self._parse_timestamp(item_data[timestamp_field])
-                        except ValueError:
-                            errors.append(f"Item {item_id} has invalid {timestamp_field}")
-                            
-            except Exception as e:
-                errors.append(f"Error validating item {item_id}: {str(e)}")
-                
-        return errors
+                        errors.append(f"Item {item_id} has invalid {timestamp_field}")
+                        
+        except Exception as e:
+            errors.append(f"Error validating item {item_id}: {str(e)}")
+            
+        return fields, errors
 
-    def _parse_timestamp(self, timestamp_str: str) -> datetime:
-        """Parse timestamp with multiple format support"""
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
-            "%Y-%m-%dT%H:%M:%S",     # ISO format without microseconds
-            "%Y-%m-%d %H:%M:%S",     # Standard format
-            "%Y-%m-%d %H:%M"         # Simple format
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(timestamp_str, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+    @staticmethod
+    def _row_tuple(item_data: Dict[str, Any], fields: Dict[str, Any]) -> tuple:
+        """
+        work_items column values for a validated item, built from the fields
+        _check_item already converted; skips constructing a throwaway WorkItem
+        """
+        # Read each key once into a local; the checks and the row reuse them
+        item_id = item_data['id']
+        title = item_data['title']
+        goal = item_data.get('goal', 'legacy')
+        description = item_data['description']
+        for name, value in (('id', item_id), ('title', title),
+                            ('goal', goal), ('description', description)):
+            if not isinstance(value, str):
+                raise ValueError(f"{name} must be a string")
+        # Goals repeat across many items; interning shares one string per goal
+        # across the batch (enum values are already shared member constants)
+        return (
+            item_id,
+            title,
+            intern(goal),
+            fields['item_type'].value,
+            description,
+            fields['priority'].value,
+            fields['status'].value,
+            fields['created_at'].isoformat(),
+            fields['updated_at'].isoformat()
+        )
+
+    def _should_stream(self) -> bool:
+        """Stream-parse only large files, and only when ijson is available"""
+        return ijson is not None and self.json_path.stat().st_size > _STREAM_THRESHOLD
+
+    def _stream_is_wrapped(self) -> bool:
+        """
+        Whether the file uses the {'items': ..., 'entry_counts': ...} layout,
+        i.e. has a top-level 'items' key wherever it appears, the same test
+        the non-streaming path applies to the loaded data
+        """
+        with open(self.json_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key' and value == 'items':
+                    return True
+        return False
+
+    def _stream_section(self, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the key/value pairs of one JSON object without loading the file"""
+        with open(self.json_path, 'rb') as f:
+            yield from ijson.kvitems(f, prefix)
+
+    @staticmethod
+    def _parse_timestamp(timestamp_str: str) -> datetime:
+        """
+        Parse timestamp with multiple format support: ISO format with or
+        without microseconds, standard format, and simple format (no seconds)
+        """
+        match = _TIMESTAMP_RE.fullmatch(timestamp_str)
+        if match is None:
+            raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+            
+        year, month, day, t_hour, t_min, t_sec, micro, s_hour, s_min, s_sec = match.groups()
+        if t_hour is not None:
+            hour, minute, second = t_hour, t_min, t_sec
+        else:
+            hour, minute, second = s_hour, s_min, s_sec or 0
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(micro.ljust(6, '0')) if micro else 0
+        )
 
     def migrate_json_to_sqlite(self, batch_size: int = 100) -> Tuple[int, List[str]]:
         """
@@ -95,62 +199,87 @@ class MigrationManager:
         self.backup_manager.create_backup(note="pre_migration")
         
         try:
-            # Read and validate JSON data
-            with open(self.json_path, 'r') as f:
-                data = json.load(f)
-            
-            validation_errors = self.validate_json_data(data)
-            if validation_errors:
-                return 0, validation_errors
-
-            # Extract data based on format
-            if isinstance(data, dict) and 'items' in data:
-                items_dict = data['items']
-                entry_counts = data.get('entry_counts', {})
+            # Read JSON data; large files are streamed so memory stays at
+            # O(batch_size)
+            if self._should_stream():
+                items_prefix = 'items' if self._stream_is_wrapped() else ''
+                items = lambda: self._stream_section(items_prefix)
+                entry_counts = dict(self._stream_section('entry_counts')) if items_prefix else {}
             else:
-                items_dict = data
-                entry_counts = {}
-
-            # Process items in batches
+                data = _json_loads(self.json_path.read_bytes())
+                
+                # Extract data based on format
+                if isinstance(data, dict) and 'items' in data:
+                    items_dict = data['items']
+                    entry_counts = data.get('entry_counts', {})
+                else:
+                    items_dict = data
+                    entry_counts = {}
+                items = items_dict.items
+            
+            # Validate and build items in a single pass, inserting batches as
+            # they fill. Everything runs in one transaction, so if any item
+            # fails validation the inserted batches are rolled back and the
+            # database is left untouched. Full batches are written on a
+            # single worker thread (sqlite releases the GIL while it runs), so
+            # the next batch is parsed and built while the previous one is
+            # inserted; at most one batch is in flight at a time.
             items_batch = []
             processed_count = 0
             migration_errors = []
+            validation_errors = []
+            pending: Optional[Future] = None
 
-            for item_data in items_dict.values():
-                try:
-                    goal = item_data.get('goal', 'legacy')
-                    
-                    # Create WorkItem
-                    item = WorkItem(
-                        id=item_data['id'],
-                        title=item_data['title'],
-                        goal=goal,
-                        item_type=ItemType(item_data['item_type']),
-                        description=item_data['description'],
-                        priority=Priority(item_data['priority']),
-                        status=ItemStatus(item_data['status']),
-                        created_at=self._parse_timestamp(item_data['created_at']),
-                        updated_at=self._parse_timestamp(item_data['updated_at'])
-                    )
-                    items_batch.append(item)
-                    
-                    # Process batch if full
-                    if len(items_batch) >= batch_size:
-                        self.db.batch_insert_items(items_batch)
-                        processed_count += len(items_batch)
-                        items_batch = []
-                        
-                except Exception as e:
-                    migration_errors.append(f"Error processing item {item_data.get('id', 'unknown')}: {str(e)}")
+            def wait_pending():
+                # Re-raises a failed insert, rolling back the whole migration
+                nonlocal pending, processed_count
+                if pending is not None:
+                    batch, pending = pending, None
+                    processed_count += batch.result()
 
-            # Process remaining items
-            if items_batch:
-                self.db.batch_insert_items(items_batch)
-                processed_count += len(items_batch)
+            try:
+                # The pool shuts down (waiting for the in-flight batch) before
+                # the transaction commits or rolls back
+                with self.db.transaction() as conn, ThreadPoolExecutor(max_workers=1) as io_pool:
+                    for item_id, item_data in items():
+                        fields, errors = self._check_item(item_id, item_data)
+                        if errors or validation_errors:
+                            # Keep scanning only to report every invalid item
+                            validation_errors.extend(errors)
+                            continue
+                            
+                        try:
+                            items_batch.append(self._row_tuple(item_data, fields))
+                        except Exception as e:
+                            migration_errors.append(f"Error processing item {item_data.get('id', 'unknown')}: {str(e)}")
+                            continue
+                            
+                        # Hand the batch to the writer once full
+                        if len(items_batch) >= batch_size:
+                            wait_pending()
+                            pending = io_pool.submit(self.db.insert_rows, conn, items_batch)
+                            items_batch = []
+                            
+                    wait_pending()
+                    if validation_errors:
+                        raise _ValidationFailed()
 
-            # Migrate entry counts
-            for goal, count in entry_counts.items():
-                self.db.update_entry_count(goal, count)
+                    # Process remaining items
+                    if items_batch:
+                        processed_count += self.db.insert_rows(conn, items_batch)
+
+                    # Migrate entry counts
+                    self.db.bulk_update_entry_counts(entry_counts)
+            except _ValidationFailed:
+                return 0, validation_errors
+
+            # The bulk load skews the planner statistics for work_items;
+            # refresh them now rather than waiting for Database.close()
+            with self.db.get_connection() as conn:
+                try:
+                    conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
 
             # Create backup of JSON file
             backup_path = self.json_path.with_suffix('.json.bak')
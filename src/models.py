@@ -22,6 +22,18 @@ class Priority(Enum):
     MED = 2    # Medium urgency/importance
     HI = 3     # High urgency/importance - critical items
 
+# Value -> member lookups for decoding stored values, cheaper than an Enum call per field
+ITEM_TYPE_BY_VALUE = {m.value: m for m in ItemType}
+STATUS_BY_VALUE = {m.value: m for m in ItemStatus}
+PRIORITY_BY_VALUE = {m.value: m for m in Priority}
+
+def enum_member(lookup: dict, enum_cls, value):
+    """Map a stored value to its enum member, falling back to the Enum call for unknown values"""
+    try:
+        return lookup[value]
+    except KeyError:
+        return enum_cls(value)
+
 class WorkItem(BaseModel):
     """
     Core data structure representing a single work item.
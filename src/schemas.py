@@ -1,7 +1,19 @@
-from pydantic import BaseModel, Field, validator, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, ValidationError, WrapValidator, validator, field_validator
+from typing import Annotated, ClassVar, Literal, Optional, Union
 from enum import Enum
 
+def _choice(message: str) -> WrapValidator:
+    """
+    Keep a descriptive error for a Literal field: the Literal check still runs
+    in pydantic-core, and only a rejected value is re-raised with message
+    """
+    def validate(value, handler):
+        try:
+            return handler(value)
+        except ValidationError:
+            raise ValueError(message)
+    return WrapValidator(validate)
+
 class CommandInput(BaseModel):
     """Base model for command input validation"""
     @classmethod
@@ -9,84 +21,81 @@ class CommandInput(BaseModel):
         """Parse and validate input string"""
         raise NotImplementedError
 
-class AddItemInput(CommandInput):
+class AddItemBase(CommandInput):
+    """Fields shared by every form of the add command"""
+    # Choice fields use Literal so pydantic-core checks them natively; the
+    # wrapper only replaces the generic literal_error message
     goal: str = Field(..., min_length=1, max_length=50)
-    type_: str = Field(..., alias="type")
-    priority: str
+    type_: Annotated[
+        Literal["t", "l", "r", "th"],
+        _choice("Type must be 't' (task), 'l' (learning), 'r' (research), or 'th' (thought)")
+    ] = Field(..., alias="type")
+    priority: Annotated[Literal["LOW", "MED", "HI"], _choice("Priority must be LOW, MED, or HI")]
     title: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=1)
-    link_to: Optional[str] = None
-    link_type: str = "references"  # Default link type
 
-    @field_validator("type_")
-    @classmethod
-    def validate_type(cls, v):
-        if v not in ["t", "l", "r", "th"]:
-            raise ValueError("Type must be 't' (task), 'l' (learning), 'r' (research), or 'th' (thought)")
-        return v
+class AddItemNoLink(AddItemBase):
+    """Add command without --link-to; the link fields are constants, not validated fields"""
+    link_to: ClassVar[Optional[str]] = None
+    link_type: ClassVar[str] = "references"
 
-    @field_validator("priority")
-    @classmethod
-    def validate_priority(cls, v):
-        if v.upper() not in ["LOW", "MED", "HI"]:
-            raise ValueError("Priority must be LOW, MED, or HI")
-        return v.upper()
+class AddItemInput(AddItemBase):
+    link_to: Optional[str] = None
+    link_type: Annotated[
+        Literal["references", "evolves-from", "inspired-by", "parent-child"],
+        _choice("Link type must be one of: references, evolves-from, inspired-by, parent-child")
+    ] = "references"
 
-    @field_validator("link_type")
     @classmethod
-    def validate_link_type(cls, v):
-        valid_link_types = ["references", "evolves-from", "inspired-by", "parent-child"]
-        if v not in valid_link_types:
-            raise ValueError(f"Link type must be one of: {', '.join(valid_link_types)}")
-        return v
+    def parse_input(cls, input_str: str) -> Union["AddItemInput", AddItemNoLink]:
+        # Common case: no optional parameters, so validate only the required fields
+        if " --link-to " not in input_str:
+            return _ADD_NO_LINK_VALIDATOR.validate_python(cls._parse_main_part(input_str))
 
-    @classmethod
-    def parse_input(cls, input_str: str) -> "AddItemInput":
-        # First, check if there are any optional parameters
-        main_part = input_str
-        link_to = None
+        parts = input_str.split(" --link-to ", 1)
+        main_part = parts[0]
         link_type = "references"  # Default link type
         
-        # Extract optional parameters if present
-        if " --link-to " in input_str:
-            parts = input_str.split(" --link-to ", 1)
-            main_part = parts[0]
-            
-            # Check if there's also a link type specified
-            if " --link-type " in parts[1]:
-                link_parts = parts[1].strip().split(" --link-type ", 1)
-                link_to = link_parts[0].strip()
-                link_type = link_parts[1].strip()
-            else:
-                link_to = parts[1].strip()
+        # Check if there's also a link type specified
+        if " --link-type " in parts[1]:
+            link_parts = parts[1].strip().split(" --link-type ", 1)
+            link_to = link_parts[0].strip()
+            link_type = link_parts[1].strip()
+        else:
+            link_to = parts[1].strip()
         
-        # Parse the main parts as before
+        data = cls._parse_main_part(main_part)
+        data["link_to"] = link_to
+        data["link_type"] = link_type
+        return _ADD_VALIDATOR.validate_python(data)
+
+    @staticmethod
+    def _parse_main_part(main_part: str) -> dict:
+        """Split goal-type-priority-title-description into a dict of raw field values"""
         parts = main_part.split('-', 4)
         if len(parts) < 5:
             raise ValueError("Format: goal-type-priority-title-description [--link-to item_id] [--link-type type]")
         
-        return cls(
-            goal=parts[0].strip(),
-            type=parts[1].strip(),
-            priority=parts[2].strip(),
-            title=parts[3].strip(),
-            description=parts[4].strip(),
-            link_to=link_to,
-            link_type=link_type
-        )
+        return {
+            "goal": parts[0].strip(),
+            "type": parts[1].strip(),
+            "priority": parts[2].strip().upper(),
+            "title": parts[3].strip(),
+            "description": parts[4].strip()
+        }
+
+# Compiled validators are captured once at import so each command only pays
+# the per-call validation cost
+_ADD_VALIDATOR = AddItemInput.__pydantic_validator__
+_ADD_NO_LINK_VALIDATOR = AddItemNoLink.__pydantic_validator__
 
 class UpdateItemInput(CommandInput):
     item_id: str = Field(..., min_length=1)
-    field: Optional[str] = None
+    field: Optional[
+        Annotated[Literal["status", "priority"], _choice("Field must be 'status' or 'priority'")]
+    ] = None
     value: str = Field(..., min_length=1)
 
-    @field_validator("field")
-    @classmethod
-    def validate_field(cls, v):
-        if v and v not in ["status", "priority"]:
-            raise ValueError("Field must be 'status' or 'priority'")
-        return v
-
     @classmethod
     def parse_input(cls, input_str: str) -> "UpdateItemInput":
         parts = input_str.split('-')
@@ -94,12 +103,18 @@ class UpdateItemInput(CommandInput):
             raise ValueError("Format: update-id-status or update-id-field-value")
         
         if len(parts) == 3:
-            return cls(item_id=parts[1].strip(), value=parts[2].strip())
-        return cls(
-            item_id=parts[1].strip(),
-            field=parts[2].strip(),
-            value=parts[3].strip()
-        )
+            return _UPDATE_VALIDATOR.validate_python({
+                "item_id": parts[1].strip(),
+                "value": parts[2].strip()
+            })
+        return _UPDATE_VALIDATOR.validate_python({
+            "item_id": parts[1].strip(),
+            # An empty field (update-id--value) is a plain status update
+            "field": parts[2].strip() or None,
+            "value": parts[3].strip()
+        })
+
+_UPDATE_VALIDATOR = UpdateItemInput.__pydantic_validator__
 
 class AddThoughtInput(CommandInput):
     goal: str = Field(..., min_length=1, max_length=50)
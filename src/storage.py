@@ -1,4 +1,6 @@
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 from contextlib import contextmanager
@@ -16,16 +18,20 @@ class WorkSystem:
     - Status and priority updates
     - Various sorting and filtering capabilities
     """
-    def __init__(self, storage_path: str = "work_items.db"):
+    def __init__(self, storage_path: str = "work_items.db", validate: bool = True):
         """
         Initialize the work system
         Args:
             storage_path: Location of the SQLite database file
+            validate: Re-validate items loaded from the database; pass False
+                when the data is known to be clean (e.g. right after a migration)
         """
         self.db = Database(storage_path)
         self.backup_manager = BackupManager(storage_path)
-        self.items = self.db.get_all_items()
+        self.items = self.db.get_all_items(validate=validate)
         self.entry_counts = self.db.get_all_entry_counts()
+        # Results of read-heavy queries (goals, filtered items); cleared on every write
+        self._query_cache: Dict[tuple, List] = {}
 
     def generate_id(self, goal: str, item_type: ItemType, priority: Priority) -> str:
         """
@@ -80,16 +86,29 @@ class WorkSystem:
     def _atomic_operation(self):
         """Ensure atomic operations with proper rollback"""
         items_snapshot = self.items.copy()
+        entry_counts_snapshot = self.entry_counts.copy()
         try:
             yield
         except Exception as e:
             self.items = items_snapshot
+            self.entry_counts = entry_counts_snapshot
             raise e
 
-    def _refresh_cache(self):
+    def _refresh_cache(self, validate: bool = True):
         """Refresh the in-memory cache from database"""
-        self.items = self.db.get_all_items()
+        self.items = self.db.get_all_items(validate=validate)
         self.entry_counts = self.db.get_all_entry_counts()
+        self._invalidate_query_cache()
+
+    def _invalidate_query_cache(self):
+        """Drop cached query results after any change to items or links"""
+        self._query_cache.clear()
+
+    def _cached_query(self, key: tuple, query) -> List:
+        """Return a copy of a cached query result, running the query on a miss"""
+        if key not in self._query_cache:
+            self._query_cache[key] = query()
+        return list(self._query_cache[key])
 
     def add_item(self, goal: str, title: str, item_type: ItemType,
                  description: str, priority: Priority = Priority.MED) -> WorkItem:
@@ -113,11 +132,13 @@ class WorkSystem:
                     description=description,
                     priority=priority
                 )
-                item.id = self.generate_id(goal, item_type, priority)
-                
-                # Add to database first
+                # Add to database first; the entry count bump and the insert
+                # share one transaction so they commit (or roll back) together,
+                # and _atomic_operation restores the in-memory count to match
                 try:
-                    self.db.add_item(item)
+                    with self.db.transaction():
+                        item.id = self.generate_id(goal, item_type, priority)
+                        self.db.add_item(item)
                 except IntegrityError:
                     raise ValueError(f"Item with ID {item.id} already exists")
                 except OperationalError as e:
@@ -125,6 +146,7 @@ class WorkSystem:
                 
                 # Update cache only after successful database operation
                 self.items[item.id] = item
+                self._invalidate_query_cache()
                 return item
                 
             except Exception as e:
@@ -144,6 +166,17 @@ class WorkSystem:
             reverse=True
         )
 
+    def get_items_grouped_by_goal(self) -> Dict[str, List[WorkItem]]:
+        """
+        Retrieves all items with a single query, grouped by goal.
+        Each group is sorted by priority (highest first), then creation time (newest first).
+        """
+        items = self.db.get_items_ordered_by_goal()
+        return {
+            goal: list(group)
+            for goal, group in groupby(items, key=attrgetter('goal'))
+        }
+
     def get_items_by_goal_priority(self, goal: str) -> List[WorkItem]:
         """Retrieves items for a goal, sorted only by priority."""
         items = self.db.get_items_by_goal(goal)
@@ -179,8 +212,18 @@ class WorkSystem:
             reverse=True
         )
 
+    def get_thoughts_by_goal(self, goal: str) -> List[WorkItem]:
+        """Get thought items for a goal (case-insensitive), highest priority first"""
+        return self.db.get_items_by_type_and_goal(ItemType.THOUGHT, goal)
+
     def get_all_goals(self) -> List[str]:
-        return self.db.get_all_goals()
+        return self._cached_query(('goals',), self.db.get_all_goals)
+
+    def get_goal_summary(self) -> Dict[str, int]:
+        """Goals mapped to their current item counts, cached until the next write"""
+        return dict(self._cached_query(
+            ('goal_summary',), lambda: self.db.get_goal_summary().items()
+        ))
 
     def update_item_status(self, item_id: str, new_status: ItemStatus):
         """Enhanced update_status with atomic operations"""
@@ -195,6 +238,7 @@ class WorkSystem:
                 try:
                     item.update_status(new_status)
                     self.db.update_item(item)
+                    self._invalidate_query_cache()
                 except Exception as e:
                     item.status = old_status  # Rollback in-memory change
                     raise RuntimeError(f"Failed to update status: {str(e)}")
@@ -216,6 +260,7 @@ class WorkSystem:
                 try:
                     item.update_priority(new_priority)
                     self.db.update_item(item)
+                    self._invalidate_query_cache()
                 except Exception as e:
                     item.priority = old_priority  # Rollback in-memory change
                     raise RuntimeError(f"Failed to update priority: {str(e)}")
@@ -278,14 +323,12 @@ class WorkSystem:
                         seen_keys[key] = item
 
                 # Remove merged duplicates atomically
-                with self.db.get_connection() as conn:
-                    for item_id in items_to_remove:
-                        conn.execute("DELETE FROM work_items WHERE id = ?", (item_id,))
-                    conn.commit()
+                self.db.delete_items(items_to_remove)
 
                 # Update cache after successful database operation
                 for item_id in items_to_remove:
                     del self.items[item_id]
+                self._invalidate_query_cache()
 
                 return merged_pairs
                 
@@ -299,14 +342,29 @@ class WorkSystem:
                          status: Optional[ItemStatus] = None,
                          priority: Optional[Priority] = None,
                          item_type: Optional[ItemType] = None) -> List[WorkItem]:
-        """Use optimized database query directly"""
-        return self.db.get_items_by_filters(
-            goal=goal,
-            status=status,
-            priority=priority,
-            item_type=item_type
+        """Use optimized database query, cached until the next write"""
+        return self._cached_query(
+            ('filtered', goal, status, priority, item_type),
+            lambda: self.db.get_items_by_filters(
+                goal=goal,
+                status=status,
+                priority=priority,
+                item_type=item_type
+            )
         )
 
+    def restore_backup(self, backup_path: Path) -> None:
+        """
+        Replace the database with a backup and reload the cache. Open
+        connections are closed first: the restore has to take the file out of
+        WAL mode, which SQLite refuses while other connections are attached.
+        """
+        self.db.close()
+        self.backup_manager.restore_backup(backup_path)
+        # Older backups predate the current indexes and views
+        self.db.ensure_schema()
+        self._refresh_cache()
+
     def optimize_database(self):
         """Optimize the database by removing unused space"""
         self.db.execute_vacuum()
@@ -330,6 +388,7 @@ class WorkSystem:
                 return False
                 
             with self._atomic_operation():
+                self._invalidate_query_cache()
                 return self.db.add_link(source_id, target_id, link_type)
         except Exception as e:
             print(f"Error adding link: {e}")
@@ -348,6 +407,7 @@ class WorkSystem:
         """
         try:
             with self._atomic_operation():
+                self._invalidate_query_cache()
                 return self.db.remove_link(source_id, target_id)
         except Exception as e:
             print(f"Error removing link: {e}")
@@ -24,8 +24,11 @@ class TestAddThoughtCommand(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test"""
+        self.work_system.db.close()
         self.temp_db.close()
-        os.unlink(self.temp_db.name)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
         
     def test_add_thought_input_parser(self):
         """Test parsing input for add_thought command"""
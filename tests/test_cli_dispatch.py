@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import tempfile
+import io
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.storage import WorkSystem
+from src.cli import WorkSystemCLI
+
+class TestCommandDispatch(unittest.TestCase):
+    """Tests for WorkSystemCLI.onecmd and its command table"""
+
+    def setUp(self):
+        """Set up a CLI backed by a temporary database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
+        self.work_system = WorkSystem(self.temp_db.name)
+        with redirect_stdout(io.StringIO()):
+            self.cli = WorkSystemCLI()
+        self.cli.work_system = self.work_system
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.work_system.db.close()
+        self.temp_db.close()
+        os.unlink(self.temp_db.name)
+
+    def run_command(self, line):
+        """Run one command line, returning its result and printed output"""
+        output = io.StringIO()
+        # cmd.Cmd writes to the stream it was created with, rich to sys.stdout
+        self.cli.stdout = output
+        with redirect_stdout(output):
+            result = self.cli.onecmd(line)
+        return result, output.getvalue()
+
+    def test_every_do_method_is_dispatched(self):
+        """The command table holds each do_* method under its command name"""
+        expected = {name[3:] for name in dir(self.cli) if name.startswith('do_')}
+        self.assertEqual(set(self.cli._cmd_table), expected)
+
+    def test_dispatch_passes_argument(self):
+        """The text after the command name reaches the handler as its argument"""
+        with mock.patch.object(self.cli, '_cmd_table', {'list': mock.Mock(return_value=None)}):
+            self.cli.onecmd("list --goal Alpha")
+            self.cli._cmd_table['list'].assert_called_once_with("--goal Alpha")
+        self.assertEqual(self.cli.lastcmd, "list --goal Alpha")
+
+    def test_unknown_command_uses_default(self):
+        """Unknown commands fall through to cmd.Cmd.default"""
+        result, output = self.run_command("frobnicate now")
+        self.assertIsNone(result)
+        self.assertIn("Unknown syntax: frobnicate now", output)
+
+    def test_quit_stops_the_loop(self):
+        """quit returns True so cmdloop exits"""
+        result, output = self.run_command("quit")
+        self.assertTrue(result)
+        self.assertIn("Goodbye!", output)
+
+    def test_unexpected_error_keeps_the_loop_running(self):
+        """An exception escaping a handler is reported and the loop continues"""
+        failing = mock.Mock(side_effect=RuntimeError("boom"))
+        with mock.patch.object(self.cli, '_cmd_table', {'list': failing}):
+            result, output = self.run_command("list")
+        self.assertFalse(result)
+        self.assertIn("Unexpected error: boom", output)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import unittest
+import os
+import sys
+import sqlite3
+import tempfile
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config import Config
+from src.database import Database
+from src.models import WorkItem, ItemType, ItemStatus, Priority
+from src.storage import WorkSystem
+
+class TestDatabaseTransactions(unittest.TestCase):
+    """Tests for Database transactions, streaming reads and maintenance"""
+
+    def setUp(self):
+        """Set up a new database for each test"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
+        self.db = Database(self.temp_db.name)
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.db.close()
+        self.temp_db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def make_item(self, title: str) -> WorkItem:
+        """Build a work item with a unique ID"""
+        return WorkItem(
+            id=f"DB-{uuid.uuid4().hex[:8]}",
+            title=title,
+            goal="TestGoal",
+            item_type=ItemType.TASK,
+            description="Test description",
+            priority=Priority.MED,
+            status=ItemStatus.NOT_STARTED,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+
+    def test_nested_failure_rolls_back_and_keeps_error(self):
+        """A failing write inside transaction() surfaces its own error and undoes the block"""
+        first = self.make_item("First")
+        duplicate = self.make_item("Duplicate")
+        duplicate.id = first.id
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db.transaction():
+                self.db.update_entry_count("TestGoal", 1)
+                self.db.add_item(first)
+                self.db.add_item(duplicate)
+
+        self.assertIsNone(self.db.get_item(first.id))
+        self.assertEqual(self.db.get_entry_count("TestGoal"), 0)
+
+        # The connection is usable again and not left inside a transaction
+        self.db.add_item(first)
+        self.assertEqual(self.db.get_item(first.id).title, "First")
+
+    def test_abandoned_iterator_keeps_transaction(self):
+        """Breaking out of an item iterator inside transaction() does not end the transaction"""
+        first, second, third = (self.make_item(title) for title in ("First", "Second", "Third"))
+        self.db.add_item(first)
+
+        with self.db.transaction():
+            self.db.add_item(second)
+            for item in self.db.iter_all_items():
+                break
+            for item in self.db.iter_items_by_filters(goal="TestGoal"):
+                break
+            self.db.add_item(third)
+
+        self.assertEqual(
+            sorted(item.title for item in self.db.iter_all_items()),
+            ["First", "Second", "Third"]
+        )
+
+    def test_vacuum_converts_to_incremental_auto_vacuum(self):
+        """The first vacuum of a file without auto_vacuum switches it to incremental mode"""
+        with self.db.get_connection() as conn:
+            conn.execute("PRAGMA auto_vacuum=NONE")
+            conn.execute("VACUUM")
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 0)
+
+        self.db.add_item(self.make_item("Kept"))
+        self.db.execute_vacuum()
+
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        self.assertEqual([item.title for item in self.db.iter_all_items()], ["Kept"])
+
+    def test_reopening_restores_wal(self):
+        """A file left in rollback-journal mode is switched back to WAL when opened"""
+        self.db.close()
+        with sqlite3.connect(self.temp_db.name) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+
+        self.db = Database(self.temp_db.name)
+
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+class TestBackupRestore(unittest.TestCase):
+    """Tests for restoring backups into a live WAL database"""
+
+    def setUp(self):
+        """Set up a work system on a fresh database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
+        self.work_system = WorkSystem(self.temp_db.name)
+        self.existing_backups = set(self.work_system.backup_manager.list_backups())
+
+    def tearDown(self):
+        """Remove the database and any backups the test created"""
+        self.work_system.db.close()
+        for backup in set(self.work_system.backup_manager.list_backups()) - self.existing_backups:
+            backup.unlink()
+        self.temp_db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def test_restore_round_trip(self):
+        """Restoring a backup brings back exactly the items it was taken with"""
+        kept = self.work_system.add_item(
+            goal="Alpha", title="Kept", item_type=ItemType.TASK, description="Before backup"
+        )
+        backup_path = self.work_system.backup_manager.create_backup(note="test")
+        self.work_system.add_item(
+            goal="Beta", title="Dropped", item_type=ItemType.TASK, description="After backup"
+        )
+
+        self.work_system.restore_backup(backup_path)
+
+        self.assertEqual(list(self.work_system.items), [kept.id])
+        self.assertEqual(self.work_system.get_goal_summary(), {"Alpha": 1})
+
+    def test_restore_backup_with_smaller_pages(self):
+        """Backups from before the 8 KB page size restore into a new WAL database"""
+        backup_path = Config.BACKUP_DIR / "work_items_20250224_145846_v.011.db"
+        if not backup_path.exists():
+            self.skipTest("bundled v.011 backup not present")
+
+        self.work_system.restore_backup(backup_path)
+
+        self.assertEqual(len(self.work_system.items), 10)
+        with self.work_system.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_failed_restore_keeps_wal(self):
+        """Restoring a file that is not a database leaves the live one in WAL mode"""
+        kept = self.work_system.add_item(
+            goal="Alpha", title="Kept", item_type=ItemType.TASK, description="Before restore"
+        )
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as corrupt:
+            corrupt.write(b"not a database" * 512)
+        try:
+            with self.assertRaises(sqlite3.DatabaseError):
+                self.work_system.restore_backup(Path(corrupt.name))
+        finally:
+            os.unlink(corrupt.name)
+
+        with self.work_system.db.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertIsNotNone(self.work_system.db.get_item(kept.id))
+
+if __name__ == '__main__':
+    unittest.main()
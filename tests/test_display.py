@@ -0,0 +1,166 @@
+import unittest
+import os
+import sys
+import io
+from datetime import datetime
+
+from rich.console import Console
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.display import Display
+from src.models import WorkItem, ItemType, ItemStatus, Priority
+
+def make_link_items(edges):
+    """Build the {item_id: (item, links)} mapping print_link_tree takes from (source, target) edges"""
+    ids = sorted({item_id for edge in edges for item_id in edge})
+    items = {}
+    for item_id in ids:
+        item = WorkItem(
+            id=item_id,
+            title=f"Item {item_id}",
+            goal="TestGoal",
+            item_type=ItemType.TASK,
+            description="Test description",
+            priority=Priority.MED,
+            status=ItemStatus.NOT_STARTED,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1)
+        )
+        links = {
+            'outgoing': [{'target_id': t, 'link_type': 'references'} for s, t in edges if s == item_id],
+            'incoming': [{'source_id': s, 'link_type': 'references'} for s, t in edges if t == item_id]
+        }
+        items[item_id] = (item, links)
+    return items
+
+class TestPrintLinkTree(unittest.TestCase):
+    """Tests for the rendered output of Display.print_link_tree"""
+
+    def setUp(self):
+        """Set up a display that records plain text"""
+        self.display = Display()
+        self.display.console = Console(file=io.StringIO(), width=120, color_system=None)
+
+    def render(self, items, root_id, max_depth):
+        """Render a link tree and return its lines"""
+        self.display.print_link_tree(items, root_id, max_depth=max_depth)
+        return self.display.console.file.getvalue().rstrip("\n").split("\n")
+
+    def test_truncated_subtree_not_reused_across_paths(self):
+        """A subtree cut off by max_depth still shows a cycle reference on a path where it cycles"""
+        items = make_link_items([("R", "A"), ("R", "Y"), ("A", "X"), ("X", "Y"), ("Y", "X")])
+
+        self.assertEqual(self.render(items, "R", max_depth=3), [
+            "Item Relationship Tree",
+            "└── R - Item R (t)",
+            "    └── Outgoing Links:",
+            "        └── references (2)",
+            "            ├── A - Item A (t)",
+            "            │   └── A - Item A (t)",
+            "            │       └── Outgoing Links:",
+            "            │           └── references (1)",
+            "            │               └── X - Item X (t)",
+            "            │                   └── X - Item X (t)",
+            "            │                       └── Outgoing Links:",
+            "            │                           └── references (1)",
+            "            │                               └── Y - Item Y (t)",
+            "            │                                   └── Y - Item Y (t)",
+            "            │                                       └── Outgoing Links:",
+            "            │                                           └── references (1)",
+            "            │                                               └── X - Item X (t)",
+            "            └── Y - Item Y (t)",
+            "                └── Y - Item Y (t)",
+            "                    └── Outgoing Links:",
+            "                        └── references (1)",
+            "                            └── X - Item X (t)",
+            "                                └── X - Item X (t)",
+            "                                    └── Outgoing Links:",
+            "                                        └── references (1)",
+            "                                            └── Y - Item Y (t)",
+            "                                                └── Y (cycle reference)",
+        ])
+
+def make_item(item_id, goal, item_type, priority, status, day):
+    """A work item created at 09:30:15 on the given day of January 2024"""
+    return WorkItem(
+        id=item_id,
+        title=f"Title {item_id}",
+        goal=goal,
+        item_type=item_type,
+        description=f"Desc {item_id}",
+        priority=priority,
+        status=status,
+        created_at=datetime(2024, 1, day, 9, 30, 15),
+        updated_at=datetime(2024, 1, day)
+    )
+
+class TestItemViews(unittest.TestCase):
+    """Tests for the rendered item tree, item table and batched messages"""
+
+    def setUp(self):
+        """Set up a plain-text display and items across two goals"""
+        self.display = Display()
+        self.display.console = Console(file=io.StringIO(), width=120, color_system=None)
+        self.items = [
+            make_item("a1", "Alpha", ItemType.TASK, Priority.LOW, ItemStatus.NOT_STARTED, 1),
+            make_item("a2", "alpha", ItemType.TASK, Priority.HI, ItemStatus.IN_PROGRESS, 2),
+            make_item("a3", "Alpha", ItemType.TASK, Priority.HI, ItemStatus.COMPLETED, 3),
+            make_item("a4", "Alpha", ItemType.THOUGHT, Priority.MED, ItemStatus.NOT_STARTED, 4),
+            make_item("b1", "Beta", ItemType.RESEARCH, Priority.MED, ItemStatus.NOT_STARTED, 5)
+        ]
+
+    def output_lines(self):
+        """Non-empty lines printed so far"""
+        return [line for line in self.display.console.file.getvalue().split("\n") if line]
+
+    def test_print_tree(self):
+        """Goals match case-insensitively; priorities descend and items are newest first"""
+        self.display.print_tree(self.items, ["Alpha", "Beta", "Empty"])
+
+        self.assertEqual(self.output_lines(), [
+            "Work System Overview",
+            "├── ALPHA",
+            "│   ├── TASK",
+            "│   │   ├── HI Priority",
+            "│   │   │   ├── a3 - Title a3 (completed)",
+            "│   │   │   └── a2 - Title a2 (in_progress)",
+            "│   │   └── LOW Priority",
+            "│   │       └── a1 - Title a1 (not_started)",
+            "│   └── THOUGHT",
+            "│       └── MED Priority",
+            "│           └── a4 - Title a4 (not_started)",
+            "└── BETA",
+            "    └── RESEARCH",
+            "        └── MED Priority",
+            "            └── b1 - Title b1 (not_started)",
+        ])
+
+    def test_print_items(self):
+        """The table shows one row per item with the created time to the minute"""
+        self.display.print_items(self.items)
+
+        self.assertEqual(self.output_lines(), [
+            "┏━━━━┳━━━━━━━┳━━━━━━━━━━┳━━━━━━┳━━━━━━━━━━┳━━━━━━━━━━━━━┳━━━━━━━━━━━━━━━━━━┳━━━━━━━━━━━━━┓",
+            "┃ ID ┃ Goal  ┃ Title    ┃ Type ┃ Priority ┃   Status    ┃ Created          ┃ Description ┃",
+            "┡━━━━╇━━━━━━━╇━━━━━━━━━━╇━━━━━━╇━━━━━━━━━━╇━━━━━━━━━━━━━╇━━━━━━━━━━━━━━━━━━╇━━━━━━━━━━━━━┩",
+            "│ a1 │ Alpha │ Title a1 │ t    │   LOW    │ not_started │ 2024-01-01 09:30 │ Desc a1     │",
+            "│ a2 │ alpha │ Title a2 │ t    │    HI    │ in_progress │ 2024-01-02 09:30 │ Desc a2     │",
+            "│ a3 │ Alpha │ Title a3 │ t    │    HI    │  completed  │ 2024-01-03 09:30 │ Desc a3     │",
+            "│ a4 │ Alpha │ Title a4 │ th   │   MED    │ not_started │ 2024-01-04 09:30 │ Desc a4     │",
+            "│ b1 │ Beta  │ Title b1 │ r    │   MED    │ not_started │ 2024-01-05 09:30 │ Desc b1     │",
+            "└────┴───────┴──────────┴──────┴──────────┴─────────────┴──────────────────┴─────────────┘",
+        ])
+
+    def test_batched_messages_flush_in_order(self):
+        """Messages inside batched() are held back, then written together in order"""
+        with self.display.batched():
+            self.display.print_error("first")
+            self.display.print_warning("second")
+            self.assertEqual(self.output_lines(), [])
+            self.display.print("third")
+
+        self.assertEqual(self.output_lines(), ["Error: first", "second", "third"])
+
+if __name__ == '__main__':
+    unittest.main()
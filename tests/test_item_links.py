@@ -49,8 +49,11 @@ class TestItemLinks(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test"""
+        self.db.close()
         self.temp_db.close()
-        os.unlink(self.temp_db.name)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
         
     def test_add_link(self):
         """Test adding a link between two items"""
@@ -38,8 +38,11 @@ class TestLinkCommands(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test"""
+        self.work_system.db.close()
         self.temp_db.close()
-        os.unlink(self.temp_db.name)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
         
     def test_link_command(self):
         """Test the link command functionality"""
@@ -65,8 +65,11 @@ class TestLinkTree(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test"""
+        self.work_system.db.close()
         self.temp_db.close()
-        os.unlink(self.temp_db.name)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
         
     def test_link_tree_basic(self):
         """Test the basic link_tree command without arguments"""
@@ -0,0 +1,208 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import migrate
+from src.migrate import MigrationManager
+
+def make_item(item_id: str, **overrides) -> dict:
+    """A valid JSON work item, with any fields replaced by overrides"""
+    item = {
+        "id": item_id,
+        "title": f"Title {item_id}",
+        "goal": "Migrated",
+        "item_type": "t",
+        "description": "From JSON",
+        "priority": 2,
+        "status": "not_started",
+        "created_at": "2024-01-02T03:04:05.123456",
+        "updated_at": "2024-01-02 03:04"
+    }
+    item.update(overrides)
+    return item
+
+class TestMigration(unittest.TestCase):
+    """Tests for migrating JSON work items into SQLite"""
+
+    def setUp(self):
+        """Set up a JSON source and an empty database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_path = Path(self.temp_dir.name) / "work_items.json"
+        self.db_path = str(Path(self.temp_dir.name) / "work_items.db")
+        self.manager = MigrationManager(str(self.json_path), self.db_path)
+        self.existing_backups = set(self.manager.backup_manager.list_backups())
+
+    def tearDown(self):
+        """Remove the temporary files and any backups the test created"""
+        self.manager.db.close()
+        for backup in set(self.manager.backup_manager.list_backups()) - self.existing_backups:
+            backup.unlink()
+        self.temp_dir.cleanup()
+
+    def write_json(self, items: dict, entry_counts: dict = None):
+        """Write items (and entry counts, if given) in the wrapped format"""
+        data = {"items": items, "entry_counts": entry_counts or {}}
+        self.json_path.write_text(json.dumps(data))
+
+    def test_migrates_items_and_entry_counts(self):
+        """Valid items and entry counts land in the database and the JSON is renamed"""
+        items = {f"m{i}": make_item(f"m{i}") for i in range(5)}
+        self.write_json(items, {"Migrated": 5})
+
+        count, errors = self.manager.migrate_json_to_sqlite(batch_size=2)
+
+        self.assertEqual((count, errors), (5, []))
+        self.assertEqual(sorted(self.manager.db.get_all_items()), sorted(items))
+        self.assertEqual(self.manager.db.get_all_entry_counts(), {"Migrated": 5})
+        self.assertFalse(self.json_path.exists())
+        self.assertTrue(self.json_path.with_suffix(".json.bak").exists())
+
+    def test_failed_batch_rolls_back_everything(self):
+        """An insert error in any batch leaves the database empty and the JSON in place"""
+        # With batches of two, the duplicate lands in the second batch (written
+        # on the worker thread) or in the final partial batch
+        for duplicate_after in (2, 5):
+            with self.subTest(duplicate_after=duplicate_after):
+                items = {}
+                for i in range(6):
+                    items[f"k{i}"] = make_item(f"m{i}")
+                    if i == duplicate_after:
+                        items["dup"] = make_item("m0")
+                self.write_json(items, {"Migrated": 7})
+
+                count, errors = self.manager.migrate_json_to_sqlite(batch_size=2)
+
+                self.assertEqual(count, 0)
+                self.assertEqual(len(errors), 1)
+                self.assertIn("UNIQUE constraint failed", errors[0])
+                self.assertEqual(self.manager.db.get_all_items(), {})
+                self.assertEqual(self.manager.db.get_all_entry_counts(), {})
+                self.assertTrue(self.json_path.exists())
+
+    def test_invalid_item_rolls_back_everything(self):
+        """Validation errors are all reported and nothing is inserted"""
+        items = {f"m{i}": make_item(f"m{i}") for i in range(5)}
+        items["m1"] = make_item("m1", status="zzz")
+        items["m4"] = make_item("m4", priority=7)
+        self.write_json(items)
+
+        count, errors = self.manager.migrate_json_to_sqlite(batch_size=2)
+
+        self.assertEqual(count, 0)
+        self.assertEqual(errors, [
+            "Item m1 has invalid status: zzz",
+            "Item m4 has invalid priority: 7"
+        ])
+        self.assertEqual(self.manager.db.get_all_items(), {})
+        self.assertTrue(self.json_path.exists())
+
+    def test_unbuildable_item_is_skipped(self):
+        """An item that validates but can't become a row is reported and the rest migrate"""
+        items = {f"m{i}": make_item(f"m{i}") for i in range(4)}
+        items["m2"] = make_item("m2", title=42)
+        self.write_json(items)
+
+        count, errors = self.manager.migrate_json_to_sqlite(batch_size=2)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(errors, ["Error processing item m2: title must be a string"])
+        self.assertEqual(sorted(self.manager.db.get_all_items()), ["m0", "m1", "m3"])
+
+    def test_row_values(self):
+        """Migrated rows keep every field, with timestamps normalized and goal defaulted"""
+        items = {"m0": make_item("m0", priority=3, status="in_progress", item_type="th")}
+        del items["m0"]["goal"]
+        self.write_json(items)
+
+        self.manager.migrate_json_to_sqlite()
+
+        item = self.manager.db.get_item("m0")
+        self.assertEqual(item.goal, "legacy")
+        self.assertEqual(item.title, "Title m0")
+        self.assertEqual(item.item_type.value, "th")
+        self.assertEqual(item.priority.value, 3)
+        self.assertEqual(item.status.value, "in_progress")
+        self.assertEqual(item.created_at, datetime(2024, 1, 2, 3, 4, 5, 123456))
+        self.assertEqual(item.updated_at, datetime(2024, 1, 2, 3, 4))
+
+    def migrate_fresh(self, data, stream: bool):
+        """Migrate data into its own new database and return the stored rows"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "work_items.json"
+            json_path.write_text(json.dumps(data))
+            manager = MigrationManager(str(json_path), str(Path(temp_dir) / "work_items.db"))
+            threshold = 0 if stream else 1 << 40
+            try:
+                with mock.patch.object(migrate, "_STREAM_THRESHOLD", threshold):
+                    result = manager.migrate_json_to_sqlite(batch_size=2)
+                return result, manager.db.get_all_items(), manager.db.get_all_entry_counts()
+            finally:
+                manager.db.close()
+
+    @unittest.skipIf(migrate.ijson is None, "ijson not installed")
+    def test_streaming_matches_full_load(self):
+        """Streamed and fully loaded files migrate to the same rows for every layout"""
+        items = {f"m{i}": make_item(f"m{i}") for i in range(5)}
+        layouts = {
+            "wrapped": {"items": items, "entry_counts": {"Migrated": 5}},
+            "wrapped, items not first": {"version": 1, "entry_counts": {"Migrated": 5}, "items": items},
+            "bare items": items
+        }
+        for name, data in layouts.items():
+            with self.subTest(layout=name):
+                loaded = self.migrate_fresh(data, stream=False)
+                streamed = self.migrate_fresh(data, stream=True)
+                self.assertEqual(loaded[0], (5, []))
+                self.assertEqual(streamed, loaded)
+
+class TestParseTimestamp(unittest.TestCase):
+    """Tests for the accepted migration timestamp layouts"""
+
+    def setUp(self):
+        """The parser is a staticmethod, so no database is needed"""
+        self.parse = MigrationManager._parse_timestamp
+
+    def test_accepted_layouts(self):
+        """ISO with or without fractional seconds, and space-separated with or without seconds"""
+        cases = {
+            "2024-01-02T03:04:05": datetime(2024, 1, 2, 3, 4, 5),
+            "2024-01-02T03:04:05.1": datetime(2024, 1, 2, 3, 4, 5, 100000),
+            "2024-01-02T03:04:05.000120": datetime(2024, 1, 2, 3, 4, 5, 120),
+            "2024-01-02T03:04:05.123456": datetime(2024, 1, 2, 3, 4, 5, 123456),
+            "2024-01-02 03:04:05": datetime(2024, 1, 2, 3, 4, 5),
+            "2024-01-02 03:04": datetime(2024, 1, 2, 3, 4),
+            "2024-1-2T3:4:5": datetime(2024, 1, 2, 3, 4, 5),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.parse(text), expected)
+
+    def test_rejected_input(self):
+        """Offsets, extra precision, missing parts and impossible dates are all errors"""
+        for text in (
+            "2024-01-02T03:04:05+00:00",
+            "2024-01-02T03:04:05Z",
+            "2024-01-02T03:04:05.123+01:00",
+            "2024-01-02T03:04:05.1234567",
+            "2024-01-02 03:04:05.5",
+            "2024-01-02T03:04",
+            "2024-01-02",
+            " 2024-01-02 03:04",
+            "2024-02-30T00:00:00",
+            "2024-01-02T24:00:00",
+            "",
+            "not a date",
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.parse(text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import sys
+
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.schemas import AddItemInput, AddItemNoLink, UpdateItemInput
+
+class TestCommandSchemas(unittest.TestCase):
+    """Tests for parsing and validating command input"""
+
+    def assert_error(self, parse, text, field, message):
+        """Parsing text fails with exactly one error on field carrying message"""
+        with self.assertRaises(ValidationError) as ctx:
+            parse(text)
+        errors = ctx.exception.errors()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["loc"][0], field)
+        self.assertEqual(errors[0]["msg"], f"Value error, {message}")
+
+    def test_add_without_link(self):
+        """Plain add commands parse into AddItemNoLink with default link fields"""
+        data = AddItemInput.parse_input("Goal-t-med-My Title-Some - description")
+        self.assertIsInstance(data, AddItemNoLink)
+        self.assertEqual(
+            (data.goal, data.type_, data.priority, data.title, data.description),
+            ("Goal", "t", "MED", "My Title", "Some - description")
+        )
+        self.assertIsNone(data.link_to)
+        self.assertEqual(data.link_type, "references")
+
+    def test_add_with_link(self):
+        """--link-to and --link-type are parsed and validated"""
+        data = AddItemInput.parse_input("Goal-th-HI-Idea-Desc --link-to abc123 --link-type inspired-by")
+        self.assertEqual((data.link_to, data.link_type), ("abc123", "inspired-by"))
+
+    def test_add_invalid_choices_keep_descriptive_errors(self):
+        """Rejected type, priority and link type values explain the accepted choices"""
+        parse = AddItemInput.parse_input
+        self.assert_error(parse, "Goal-x-LOW-Title-Desc", "type",
+                          "Type must be 't' (task), 'l' (learning), 'r' (research), or 'th' (thought)")
+        self.assert_error(parse, "Goal-t-URGENT-Title-Desc", "priority",
+                          "Priority must be LOW, MED, or HI")
+        self.assert_error(parse, "Goal-t-LOW-Title-Desc --link-to abc --link-type likes", "link_type",
+                          "Link type must be one of: references, evolves-from, inspired-by, parent-child")
+
+    def test_add_requires_all_parts(self):
+        """Missing parts are reported with the expected format"""
+        with self.assertRaisesRegex(ValueError, "Format: goal-type-priority-title-description"):
+            AddItemInput.parse_input("Goal-t-LOW-Title")
+
+    def test_update_input(self):
+        """Update accepts a bare status or a status/priority field, and explains bad fields"""
+        data = UpdateItemInput.parse_input("update-abc-done")
+        self.assertEqual((data.item_id, data.field, data.value), ("abc", None, "done"))
+        data = UpdateItemInput.parse_input("update-abc--completed")
+        self.assertEqual((data.item_id, data.field, data.value), ("abc", None, "completed"))
+        data = UpdateItemInput.parse_input("update-abc-priority-HI")
+        self.assertEqual((data.field, data.value), ("priority", "HI"))
+        self.assert_error(UpdateItemInput.parse_input, "update-abc-color-red", "field",
+                          "Field must be 'status' or 'priority'")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import ItemType, Priority
+from src.storage import WorkSystem
+
+class TestStorageQueries(unittest.TestCase):
+    """Tests for the batched WorkSystem query helpers"""
+    
+    def setUp(self):
+        """Set up a temporary database with items across several goals"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
+        self.work_system = WorkSystem(self.temp_db.name)
+        
+        # Goals use distinct initials so generated IDs don't collide
+        self.alpha_low = self.work_system.add_item(
+            goal="Alpha",
+            title="Alpha Low",
+            item_type=ItemType.TASK,
+            description="Low priority task",
+            priority=Priority.LOW
+        )
+        self.alpha_high = self.work_system.add_item(
+            goal="Alpha",
+            title="Alpha High",
+            item_type=ItemType.THOUGHT,
+            description="High priority thought",
+            priority=Priority.HI
+        )
+        self.beta = self.work_system.add_item(
+            goal="Beta",
+            title="Beta Task",
+            item_type=ItemType.TASK,
+            description="Another goal"
+        )
+        
+    def tearDown(self):
+        """Clean up after each test"""
+        self.work_system.db.close()
+        self.temp_db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+        
+    def test_get_items_grouped_by_goal(self):
+        """Items are grouped per goal and sorted by priority within a group"""
+        grouped = self.work_system.get_items_grouped_by_goal()
+        
+        self.assertEqual(list(grouped.keys()), ["Alpha", "Beta"])
+        self.assertEqual(
+            [item.id for item in grouped["Alpha"]],
+            [self.alpha_high.id, self.alpha_low.id]
+        )
+        self.assertEqual([item.id for item in grouped["Beta"]], [self.beta.id])
+
+    def test_get_thoughts_by_goal(self):
+        """Thoughts are filtered by goal without regard to case"""
+        thoughts = self.work_system.get_thoughts_by_goal("alpha")
+        
+        self.assertEqual([t.id for t in thoughts], [self.alpha_high.id])
+        self.assertEqual(self.work_system.get_thoughts_by_goal("Beta"), [])
+
+    def test_filtered_items_cache_invalidated_on_write(self):
+        """Cached tree queries are refreshed after items change"""
+        self.assertEqual(len(self.work_system.get_filtered_items()), 3)
+        self.assertEqual(sorted(self.work_system.get_all_goals()), ["Alpha", "Beta"])
+        
+        self.work_system.add_item(
+            goal="Gamma",
+            title="Gamma Task",
+            item_type=ItemType.TASK,
+            description="Added after the first read"
+        )
+        
+        self.assertEqual(len(self.work_system.get_filtered_items()), 4)
+        self.assertIn("Gamma", self.work_system.get_all_goals())
+
+    def test_get_goal_summary(self):
+        """Goal summary counts the items currently stored per goal"""
+        self.assertEqual(self.work_system.get_goal_summary(), {"Alpha": 2, "Beta": 1})
+
+    def test_add_item_duplicate_id_raises_value_error(self):
+        """An ID collision is reported as a ValueError and leaves the database unchanged"""
+        stored_count = self.work_system.db.get_entry_count("Alpha")
+        real_generate_id = self.work_system.generate_id
+        
+        def colliding_id(*args):
+            # Bump the entry count as usual, then hand out an ID already in use
+            real_generate_id(*args)
+            return self.alpha_low.id
+        
+        with mock.patch.object(self.work_system, "generate_id", side_effect=colliding_id):
+            with self.assertRaisesRegex(ValueError, f"Item with ID {self.alpha_low.id} already exists"):
+                self.work_system.add_item(
+                    goal="Alpha",
+                    title="Colliding Task",
+                    item_type=ItemType.TASK,
+                    description="Gets an existing ID"
+                )
+        
+        self.assertEqual(self.work_system.db.get_item(self.alpha_low.id).title, "Alpha Low")
+        self.assertEqual(self.work_system.db.get_entry_count("Alpha"), stored_count)
+        self.assertEqual(self.work_system.entry_counts["Alpha"], stored_count)
+        self.assertEqual(len(self.work_system.get_filtered_items()), 3)
+
+if __name__ == '__main__':
+    unittest.main()
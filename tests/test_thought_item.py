@@ -22,8 +22,12 @@ class TestThoughtItem(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test"""
+        self.db.close()
+        self.work_system.db.close()
         self.temp_db.close()
-        os.unlink(self.temp_db.name)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
         
     def test_create_thought_item(self):
         """Test creating a thought item directly"""